@@ -41,46 +41,91 @@ Author: MiniMax Agent
 Version: 1.0.0
 """
 
-from hypersim_sdk.core.hypersim_sdk import HyperSimSDK, HyperSimConfig
-from hypersim_sdk.types.network import Network, BlockType, NetworkConfig
-from hypersim_sdk.types.simulation import (
-    TransactionRequest,
-    SimulationResult,
-    BundleOptimization,
-    ExecutionTrace,
-    StateChange,
-    SimulationEvent,
-    HyperCoreData,
-    Position,
-    MarketData
-)
-from hypersim_sdk.types.ai import (
-    AIInsights,
-    RiskLevel,
-    GasOptimization,
-    OptimizationTechnique
-)
-from hypersim_sdk.types.websocket import (
-    WSSubscription,
-    WSMessage,
-    SubscriptionType,
-    ConnectionState
-)
-from hypersim_sdk.types.errors import (
-    HyperSimError,
-    ValidationError,
-    SimulationError,
-    NetworkError,
-    AIAnalysisError,
-    TimeoutError,
-    RateLimitError,
-    ConfigurationError
-)
-from hypersim_sdk.clients.hyperevm_client import HyperEVMClient
-from hypersim_sdk.clients.hypercore_client import HyperCoreClient
-from hypersim_sdk.clients.websocket_client import WebSocketClient
-from hypersim_sdk.ai.ai_analyzer import AIAnalyzer
-from hypersim_sdk.plugins import Plugin, PluginConfig, hook
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List
+
+if TYPE_CHECKING:
+    from hypersim_sdk.core.hypersim_sdk import HyperSimSDK, HyperSimConfig
+    from hypersim_sdk.types.network import Network, BlockType, NetworkConfig
+    from hypersim_sdk.types.simulation import (
+        TransactionRequest,
+        SimulationResult,
+        BundleOptimization,
+        ExecutionTrace,
+        StateChange,
+        SimulationEvent,
+        HyperCoreData,
+        Position,
+        MarketData
+    )
+    from hypersim_sdk.types.ai import (
+        AIInsights,
+        RiskLevel,
+        GasOptimization,
+        OptimizationTechnique
+    )
+    from hypersim_sdk.types.websocket import (
+        WSSubscription,
+        WSMessage,
+        SubscriptionType,
+        ConnectionState
+    )
+    from hypersim_sdk.types.errors import (
+        HyperSimError,
+        ValidationError,
+        SimulationError,
+        NetworkError,
+        AIAnalysisError,
+        TimeoutError,
+        RateLimitError,
+        ConfigurationError
+    )
+    from hypersim_sdk.clients.hyperevm_client import HyperEVMClient
+    from hypersim_sdk.clients.hypercore_client import HyperCoreClient
+    from hypersim_sdk.clients.websocket_client import WebSocketClient
+    from hypersim_sdk.plugins import Plugin, PluginConfig, hook
+    from hypersim_sdk.ai.ai_analyzer import AIAnalyzer
+
+# Public name -> defining module; imported on first attribute access (PEP 562)
+_LAZY: Dict[str, str] = {
+    "HyperSimSDK": "hypersim_sdk.core.hypersim_sdk",
+    "HyperSimConfig": "hypersim_sdk.core.hypersim_sdk",
+    "Network": "hypersim_sdk.types.network",
+    "BlockType": "hypersim_sdk.types.network",
+    "NetworkConfig": "hypersim_sdk.types.network",
+    "TransactionRequest": "hypersim_sdk.types.simulation",
+    "SimulationResult": "hypersim_sdk.types.simulation",
+    "BundleOptimization": "hypersim_sdk.types.simulation",
+    "ExecutionTrace": "hypersim_sdk.types.simulation",
+    "StateChange": "hypersim_sdk.types.simulation",
+    "SimulationEvent": "hypersim_sdk.types.simulation",
+    "HyperCoreData": "hypersim_sdk.types.simulation",
+    "Position": "hypersim_sdk.types.simulation",
+    "MarketData": "hypersim_sdk.types.simulation",
+    "AIInsights": "hypersim_sdk.types.ai",
+    "RiskLevel": "hypersim_sdk.types.ai",
+    "GasOptimization": "hypersim_sdk.types.ai",
+    "OptimizationTechnique": "hypersim_sdk.types.ai",
+    "WSSubscription": "hypersim_sdk.types.websocket",
+    "WSMessage": "hypersim_sdk.types.websocket",
+    "SubscriptionType": "hypersim_sdk.types.websocket",
+    "ConnectionState": "hypersim_sdk.types.websocket",
+    "HyperSimError": "hypersim_sdk.types.errors",
+    "ValidationError": "hypersim_sdk.types.errors",
+    "SimulationError": "hypersim_sdk.types.errors",
+    "NetworkError": "hypersim_sdk.types.errors",
+    "AIAnalysisError": "hypersim_sdk.types.errors",
+    "TimeoutError": "hypersim_sdk.types.errors",
+    "RateLimitError": "hypersim_sdk.types.errors",
+    "ConfigurationError": "hypersim_sdk.types.errors",
+    "HyperEVMClient": "hypersim_sdk.clients.hyperevm_client",
+    "HyperCoreClient": "hypersim_sdk.clients.hypercore_client",
+    "WebSocketClient": "hypersim_sdk.clients.websocket_client",
+    "AIAnalyzer": "hypersim_sdk.ai.ai_analyzer",
+    "Plugin": "hypersim_sdk.plugins",
+    "PluginConfig": "hypersim_sdk.plugins",
+    "hook": "hypersim_sdk.plugins",
+}
 
 # Version information
 __version__ = "1.0.0"
@@ -150,3 +195,19 @@ __all__ = [
     "__author__",
     "__license__"
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import public names on first access so unused submodules never load."""
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """List lazily imported names alongside the loaded module globals."""
+    return sorted(set(globals()) | set(_LAZY))
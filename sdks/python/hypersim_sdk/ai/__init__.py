@@ -2,8 +2,9 @@
 AI package initialization.
 """
 
-from .ai_analyzer import AIAnalyzer
+from .ai_analyzer import AIAnalyzer, get_shared_analyzer
 
 __all__ = [
-    "AIAnalyzer"
+    "AIAnalyzer",
+    "get_shared_analyzer"
 ]
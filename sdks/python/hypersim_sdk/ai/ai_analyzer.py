@@ -3,9 +3,15 @@ AI-powered transaction analysis using OpenAI GPT-4 with AsyncIO.
 """
 
 import asyncio
-import json
-from typing import Dict, Any, List, Optional
-from openai import AsyncOpenAI
+import hashlib
+import importlib.util
+import logging
+import random
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Tuple, Type, Union
 from ..types.ai import (
     AIConfig, AIInsights, AnalysisRequest, GasOptimization, 
     OptimizationTechnique, RiskLevel, OptimizationDifficulty
@@ -13,10 +19,194 @@ from ..types.ai import (
 from ..types.simulation import SimulationResult, BundleOptimization
 from ..types.errors import AIAnalysisError, RateLimitError, ConfigurationError, ValidationError
 from ..utils.validators import validate_openai_api_key
+from ..utils.serialization import JSONDecodeError, json_loads, json_dumps_bytes, json_dumps_pretty
+
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI
+
+
+logger = logging.getLogger(__name__)
+
+
+# First integer in a gas figure such as "1,234 gas"; thousands separators allowed
+_GAS_RE = re.compile(r"\d[\d,]*")
+
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Enum lookups for model replies, keyed by value and by the upper-case names
+# the prompts ask for; unknown strings fall back to MEDIUM
+_DIFF_MAP: Dict[str, OptimizationDifficulty] = {
+    **{m.name: m for m in OptimizationDifficulty},
+    **{m.value: m for m in OptimizationDifficulty},
+}
+_DEFAULT_DIFF = OptimizationDifficulty.MEDIUM
+_RISK_MAP: Dict[str, RiskLevel] = {
+    **{m.name: m for m in RiskLevel},
+    **{m.value: m for m in RiskLevel},
+}
+_DEFAULT_RISK = RiskLevel.MEDIUM
+
+_ANALYZERS: Dict[Tuple[str, str], "AIAnalyzer"] = {}
+_ANALYZERS_LOCK = threading.Lock()
+
+_SYSTEM_PROMPT = """You are an expert blockchain transaction analyzer specializing in HyperEVM.
+
+HyperEVM Context:
+- Dual-block system: Small blocks (2M gas, 1s) and Large blocks (30M gas, 1min)
+- Cross-layer integration with HyperCore trading system
+- EIP-1559 fee mechanism with complete fee burning
+- Precompiled contracts for core interactions
+
+Provide analysis in JSON format with these fields:
+{
+  "riskLevel": "LOW|MEDIUM|HIGH",
+  "gasOptimization": {
+    "potentialSavings": "amount in gas",
+    "techniques": [{
+      "name": "",
+      "description": "",
+      "estimatedSavings": "",
+      "difficulty": "EASY|MEDIUM|HARD"
+    }]
+  },
+  "securityWarnings": ["warning1", "warning2"],
+  "performanceSuggestions": ["suggestion1", "suggestion2"],
+  "explanation": "detailed analysis",
+  "confidence": 0.95,
+  "recommendations": ["action1", "action2"]
+}"""
+
+_BUNDLE_SYSTEM_PROMPT = """You are an expert at optimizing transaction bundles for HyperEVM.
+
+Provide optimization in JSON format:
+{
+  "reorderedIndices": [0, 2, 1],
+  "gasSavings": "estimated savings in gas",
+  "suggestions": ["suggestion1", "suggestion2"],
+  "warnings": ["warning1", "warning2"],
+  "confidence": 0.85
+}"""
+
+_SECURITY_SYSTEM_PROMPT = """You are a blockchain security expert analyzing HyperEVM transactions.
+
+Provide security analysis in JSON format:
+{
+  "riskLevel": "LOW|MEDIUM|HIGH|CRITICAL",
+  "vulnerabilities": [{
+    "name": "",
+    "severity": "LOW|MEDIUM|HIGH|CRITICAL",
+    "description": "",
+    "impact": "",
+    "recommendation": ""
+  }],
+  "warnings": ["warning1", "warning2"],
+  "recommendations": ["rec1", "rec2"]
+}"""
+
+_FUSED_SYSTEM_PROMPT = """You are an expert blockchain transaction analyzer specializing in HyperEVM.
+
+HyperEVM Context:
+- Dual-block system: Small blocks (2M gas, 1s) and Large blocks (30M gas, 1min)
+- Cross-layer integration with HyperCore trading system
+- EIP-1559 fee mechanism with complete fee burning
+- Precompiled contracts for core interactions
+
+Provide transaction analysis, security analysis and optimization together in JSON format:
+{
+  "analysis": {
+    "riskLevel": "LOW|MEDIUM|HIGH",
+    "gasOptimization": {
+      "potentialSavings": "amount in gas",
+      "techniques": [{
+        "name": "",
+        "description": "",
+        "estimatedSavings": "",
+        "difficulty": "EASY|MEDIUM|HARD"
+      }]
+    },
+    "securityWarnings": ["warning1", "warning2"],
+    "performanceSuggestions": ["suggestion1", "suggestion2"],
+    "explanation": "detailed analysis",
+    "confidence": 0.95,
+    "recommendations": ["action1", "action2"]
+  },
+  "security": {
+    "riskLevel": "LOW|MEDIUM|HIGH|CRITICAL",
+    "vulnerabilities": [{
+      "name": "",
+      "severity": "LOW|MEDIUM|HIGH|CRITICAL",
+      "description": "",
+      "impact": "",
+      "recommendation": ""
+    }],
+    "warnings": ["warning1", "warning2"],
+    "recommendations": ["rec1", "rec2"]
+  },
+  "optimization": {
+    "gasSavings": "estimated savings in gas",
+    "suggestions": ["suggestion1", "suggestion2"],
+    "warnings": ["warning1", "warning2"],
+    "confidence": 0.85
+  }
+}"""
+
+# Fallbacks for fields the model may omit from its JSON reply
+_INSIGHTS_DEFAULTS: Dict[str, Any] = {
+    "riskLevel": "MEDIUM",
+    "gasOptimization": {},
+    "securityWarnings": (),
+    "performanceSuggestions": (),
+    "explanation": "Analysis completed",
+    "confidence": 0.8,
+    "recommendations": (),
+}
+
+_GAS_OPTIMIZATION_DEFAULTS: Dict[str, Any] = {
+    "potentialSavings": "0",
+    "techniques": (),
+}
+
+_TECHNIQUE_DEFAULTS: Dict[str, Any] = {
+    "name": "Unknown",
+    "description": "",
+    "estimatedSavings": "0",
+    "difficulty": "MEDIUM",
+}
+
+_BUNDLE_DEFAULTS: Dict[str, Any] = {
+    "gasSavings": "0",
+    "suggestions": (),
+    "warnings": None,
+    "confidence": None,
+}
+
+_BUNDLE_PROMPT_FOOTER = """Provide optimization suggestions including:
+1. Optimal transaction ordering
+2. Gas savings opportunities
+3. Block type considerations
+4. Bundle-specific recommendations"""
+
+
+def _retry_after_seconds(error: Exception, default: float) -> float:
+    """Read the Retry-After delay from an OpenAI rate-limit error."""
+    try:
+        return float(error.response.headers.get("retry-after", default))
+    except (AttributeError, TypeError, ValueError):
+        return default
 
 
 class AIAnalyzer:
-    """AI analyzer for transaction simulation results using OpenAI."""
+    """AI analyzer for transaction simulation results using OpenAI.
+    
+    Each analyzer owns an ``AsyncOpenAI`` client and its connection pool, so
+    instances should be long-lived and reused across calls. Use
+    :func:`get_shared_analyzer` rather than constructing one per request.
+    """
+    
+    __slots__ = (
+        "config", "client", "_rate_limit_error", "_sem", "_req_kwargs",
+        "_cache", "_cache_active", "_enc", "_closed"
+    )
     
     def __init__(self, config: AIConfig) -> None:
         """Initialize AI analyzer.
@@ -29,14 +219,49 @@ class AIAnalyzer:
         """
         validate_openai_api_key(config.api_key)
         
+        # Imported here so SDK users without AI features never load openai
+        import httpx
+        from openai import AsyncOpenAI, RateLimitError as OpenAIRateLimitError
+        
         self.config = config
-        self.client = AsyncOpenAI(
+        self._rate_limit_error: Type[Exception] = OpenAIRateLimitError
+        self.client: "AsyncOpenAI" = AsyncOpenAI(
             api_key=config.api_key,
-            timeout=config.timeout
+            timeout=config.timeout,
+            # Connection pool shared by every request this analyzer makes
+            http_client=httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+                http2=_HTTP2_AVAILABLE,
+                timeout=config.timeout
+            )
         )
-        
-        if self.config.debug:
-            print(f"[AI Analyzer] Initialized with model: {self.config.model}")
+        self._sem = asyncio.Semaphore(config.max_concurrency)
+        # Invariant completion arguments, built once instead of per request
+        self._req_kwargs: Dict[str, Any] = {
+            "model": config.model,
+            "max_tokens": config.max_tokens,
+            "temperature": config.temperature,
+            "response_format": {"type": "json_object"},
+            "timeout": config.timeout,
+            "stream": True,
+        }
+        # Responses are only reproducible, and so cacheable, at temperature 0
+        self._cache: OrderedDict[bytes, Tuple[float, str]] = OrderedDict()
+        self._cache_active = (
+            config.cache_enabled and config.cache_size > 0 and config.temperature == 0
+        )
+        # tiktoken encoding, loaded on first use; False once known unavailable
+        self._enc: Any = None
+        self._closed = False
+        
+        if config.debug:
+            logger.setLevel(logging.DEBUG)
+            if not logger.handlers:
+                handler = logging.StreamHandler()
+                handler.setFormatter(logging.Formatter("[AI Analyzer] %(message)s"))
+                logger.addHandler(handler)
+        
+        logger.debug("Initialized with model: %s", config.model)
     
     async def analyze_simulation(self, simulation: SimulationResult) -> AIInsights:
         """Analyze simulation result with AI.
@@ -52,12 +277,11 @@ class AIAnalyzer:
             RateLimitError: If API rate limit is exceeded
         """
         try:
-            if self.config.debug:
-                print(f"[AI Analyzer] Analyzing simulation: {simulation.success}")
+            logger.debug("Analyzing simulation: %s", simulation.success)
             
             analysis_prompt = self._build_analysis_prompt(simulation)
             
-            response = await self._make_openai_request([
+            content = await self._make_openai_request([
                 {
                     "role": "system",
                     "content": self._get_system_prompt()
@@ -68,25 +292,47 @@ class AIAnalyzer:
                 }
             ])
             
-            content = response.choices[0].message.content
             if not content:
                 raise AIAnalysisError("Empty response from AI model")
             
-            analysis_data = json.loads(content)
+            analysis_data = json_loads(content)
             insights = self._parse_ai_response(analysis_data, simulation)
             
-            if self.config.debug:
-                print(f"[AI Analyzer] Analysis complete: {insights.risk_level}")
+            logger.debug("Analysis complete: %s", insights.risk_level)
             
             return insights
         
-        except json.JSONDecodeError as e:
+        except JSONDecodeError as e:
             raise AIAnalysisError(f"Failed to parse AI response: {e}")
+        except self._rate_limit_error as e:
+            raise RateLimitError(
+                "OpenAI API rate limit exceeded",
+                retry_after=int(_retry_after_seconds(e, 60))
+            )
         except Exception as e:
-            if "rate limit" in str(e).lower():
-                raise RateLimitError("OpenAI API rate limit exceeded", retry_after=60)
             raise AIAnalysisError(f"AI analysis failed: {e}")
     
+    async def analyze_simulations(
+        self,
+        simulations: List[SimulationResult]
+    ) -> List[Union[AIInsights, Exception]]:
+        """Analyze several simulation results concurrently.
+        
+        Requests share the analyzer's OpenAI client and are bounded by
+        ``config.max_concurrency`` in-flight calls.
+        
+        Args:
+            simulations: Simulation results to analyze
+            
+        Returns:
+            List of AIInsights in input order; a failed analysis is returned
+            as its exception instead of aborting the whole batch
+        """
+        return await asyncio.gather(
+            *(self.analyze_simulation(simulation) for simulation in simulations),
+            return_exceptions=True
+        )
+    
     async def optimize_bundle(self, simulations: List[SimulationResult]) -> BundleOptimization:
         """Optimize transaction bundle with AI.
         
@@ -104,9 +350,9 @@ class AIAnalyzer:
             raise ValidationError("Simulations list cannot be empty")
         
         try:
-            bundle_prompt = self._build_bundle_optimization_prompt(simulations)
+            bundle_prompt, total_gas = self._build_bundle_optimization_prompt(simulations)
             
-            response = await self._make_openai_request([
+            content = await self._make_openai_request([
                 {
                     "role": "system",
                     "content": self._get_bundle_optimization_system_prompt()
@@ -117,18 +363,20 @@ class AIAnalyzer:
                 }
             ])
             
-            content = response.choices[0].message.content
             if not content:
                 raise AIAnalysisError("Empty response from AI model")
             
-            optimization_data = json.loads(content)
-            return self._parse_bundle_optimization(optimization_data, simulations)
+            optimization_data = json_loads(content)
+            return self._parse_bundle_optimization(optimization_data, simulations, total_gas)
         
-        except json.JSONDecodeError as e:
+        except JSONDecodeError as e:
             raise AIAnalysisError(f"Failed to parse optimization response: {e}")
+        except self._rate_limit_error as e:
+            raise RateLimitError(
+                "OpenAI API rate limit exceeded",
+                retry_after=int(_retry_after_seconds(e, 60))
+            )
         except Exception as e:
-            if "rate limit" in str(e).lower():
-                raise RateLimitError("OpenAI API rate limit exceeded", retry_after=60)
             raise AIAnalysisError(f"Bundle optimization failed: {e}")
     
     async def analyze_security_risks(self, simulation: SimulationResult) -> Dict[str, Any]:
@@ -142,7 +390,7 @@ class AIAnalyzer:
         """
         security_prompt = self._build_security_analysis_prompt(simulation)
         
-        response = await self._make_openai_request([
+        content = await self._make_openai_request([
             {
                 "role": "system",
                 "content": self._get_security_analysis_system_prompt()
@@ -153,233 +401,369 @@ class AIAnalyzer:
             }
         ])
         
-        content = response.choices[0].message.content
         if not content:
             raise AIAnalysisError("Empty security analysis response")
         
-        return json.loads(content)
+        return json_loads(content)
+    
+    async def analyze_all(self, simulation: SimulationResult) -> Dict[str, Any]:
+        """Run analysis, security review and optimization in one request.
+        
+        Equivalent to calling :meth:`analyze_simulation`,
+        :meth:`analyze_security_risks` and :meth:`optimize_bundle` on the
+        same simulation, but with a single OpenAI round-trip.
+        
+        Args:
+            simulation: Simulation result to analyze
+            
+        Returns:
+            Dict with ``analysis`` (AIInsights), ``security`` (dict) and
+            ``optimization`` (BundleOptimization) entries
+            
+        Raises:
+            AIAnalysisError: If analysis fails
+            RateLimitError: If API rate limit is exceeded
+        """
+        try:
+            prompt = "\n".join([
+                self._build_analysis_prompt(simulation),
+                "Also identify potential security risks and vulnerabilities, "
+                "and gas savings opportunities for this transaction."
+            ])
+            
+            content = await self._make_openai_request([
+                {
+                    "role": "system",
+                    "content": _FUSED_SYSTEM_PROMPT
+                },
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ])
+            
+            if not content:
+                raise AIAnalysisError("Empty response from AI model")
+            
+            data = json_loads(content)
+            return {
+                "analysis": self._parse_ai_response(data.get("analysis", {}), simulation),
+                "security": data.get("security", {}),
+                "optimization": self._parse_bundle_optimization(
+                    data.get("optimization", {}), [simulation], int(simulation.gas_used)
+                ),
+            }
+        
+        except JSONDecodeError as e:
+            raise AIAnalysisError(f"Failed to parse AI response: {e}")
+        except self._rate_limit_error as e:
+            raise RateLimitError(
+                "OpenAI API rate limit exceeded",
+                retry_after=int(_retry_after_seconds(e, 60))
+            )
+        except Exception as e:
+            raise AIAnalysisError(f"AI analysis failed: {e}")
     
-    async def _make_openai_request(self, messages: List[Dict[str, str]]) -> Any:
-        """Make request to OpenAI API with retry logic.
+    async def _make_openai_request(self, messages: List[Dict[str, str]]) -> str:
+        """Make streaming request to OpenAI API with retry logic.
+        
+        The completion is streamed so the body is received while the model is
+        still generating; the JSON is parsed once the stream ends.
         
         Args:
             messages: Messages to send to API
             
         Returns:
-            OpenAI response
+            str: Concatenated message content (empty if the model sent none)
         """
+        cache_key: Optional[bytes] = None
+        if self._cache_active:
+            cache_key = hashlib.blake2b(
+                json_dumps_bytes([self.config.model, messages]), digest_size=16
+            ).digest()
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                if cached[0] > time.monotonic():
+                    self._cache.move_to_end(cache_key)
+                    return cached[1]
+                del self._cache[cache_key]
+        
         for attempt in range(self.config.retry_attempts + 1):
             try:
-                return await self.client.chat.completions.create(
-                    model=self.config.model,
-                    messages=messages,
-                    max_tokens=self.config.max_tokens,
-                    temperature=self.config.temperature,
-                    response_format={"type": "json_object"},
-                    timeout=self.config.timeout
-                )
-            except Exception as e:
+                async with self._sem:
+                    stream = await self.client.chat.completions.create(
+                        messages=messages, **self._req_kwargs
+                    )
+                    
+                    parts: List[str] = []
+                    async for chunk in stream:
+                        if chunk.choices:
+                            delta = chunk.choices[0].delta.content
+                            if delta:
+                                parts.append(delta)
+                    
+                    content = "".join(parts)
+                
+                if cache_key is not None and content:
+                    self._cache[cache_key] = (time.monotonic() + self.config.cache_ttl, content)
+                    if len(self._cache) > self.config.cache_size:
+                        self._cache.popitem(last=False)
+                
+                return content
+            except self._rate_limit_error as e:
+                if attempt == self.config.retry_attempts:
+                    raise
+                
+                # Full-jitter backoff so concurrent callers don't retry in
+                # lockstep; Retry-After, when sent, is a lower bound
+                delay = random.uniform(0, min(2 ** attempt, 60))
+                await asyncio.sleep(min(max(delay, _retry_after_seconds(e, 0)), 60))
+            except Exception:
                 if attempt == self.config.retry_attempts:
                     raise
                 
-                if "rate limit" in str(e).lower():
-                    # Exponential backoff for rate limits
-                    delay = min(2 ** attempt, 60)
-                    await asyncio.sleep(delay)
-                else:
-                    # Short delay for other errors
-                    await asyncio.sleep(1)
+                # Short delay for other errors
+                await asyncio.sleep(1)
     
     def _build_analysis_prompt(self, simulation: SimulationResult) -> str:
         """Build analysis prompt for simulation."""
-        prompt = f"""Analyze this HyperEVM transaction simulation:
-
-Simulation Details:
-- Success: {simulation.success}
-- Gas Used: {simulation.gas_used}
-- Block Type: {simulation.block_type}
-- Estimated Block: {simulation.estimated_block}"""
+        parts: List[str] = [
+            "Analyze this HyperEVM transaction simulation:",
+            "",
+            "Simulation Details:",
+            f"- Success: {simulation.success}",
+            f"- Gas Used: {simulation.gas_used}",
+            f"- Block Type: {simulation.block_type}",
+            f"- Estimated Block: {simulation.estimated_block}",
+        ]
         
         if simulation.error:
-            prompt += f"\n- Error: {simulation.error}"
+            parts.append(f"- Error: {simulation.error}")
         
         if simulation.revert_reason:
-            prompt += f"\n- Revert Reason: {simulation.revert_reason}"
+            parts.append(f"- Revert Reason: {simulation.revert_reason}")
         
         if simulation.return_data:
-            prompt += f"\n- Return Data: {simulation.return_data}"
+            parts.append(f"- Return Data: {simulation.return_data}")
         
+        hypercore_index = -1
         if simulation.hypercore_data:
-            prompt += f"\n- HyperCore Data: {json.dumps(simulation.hypercore_data.model_dump(), indent=2)}"
+            hypercore_index = len(parts)
+            parts.append(f"- HyperCore Data: {simulation.hypercore_data.model_dump_json(indent=2)}")
         
         if simulation.events:
-            prompt += f"\n- Events Emitted: {len(simulation.events)}"
+            parts.append(f"- Events Emitted: {len(simulation.events)}")
         
         if simulation.state_changes:
-            prompt += f"\n- State Changes: {len(simulation.state_changes)}"
-        
-        prompt += "\n\nProvide comprehensive analysis including risk assessment, gas optimization, and security insights."
+            parts.append(f"- State Changes: {len(simulation.state_changes)}")
+        
+        parts.append("")
+        parts.append("Provide comprehensive analysis including risk assessment, gas optimization, and security insights.")
+        
+        prompt = "\n".join(parts)
+        if hypercore_index >= 0 and self._exceeds_prompt_budget(prompt):
+            # Oversized prompts are only rejected after the full upload, so
+            # swap the verbatim HyperCore dump for a summary up front
+            hypercore = simulation.hypercore_data
+            summary = {
+                "coreStateKeys": len(hypercore.core_state),
+                "positions": len(hypercore.positions or ()),
+                "interactions": len(hypercore.interactions or ()),
+                "marketData": hypercore.market_data is not None,
+            }
+            parts[hypercore_index] = f"- HyperCore Data (summary): {json_dumps_pretty(summary)}"
+            prompt = "\n".join(parts)
+            
+            if logger.isEnabledFor(logging.DEBUG) and self._exceeds_prompt_budget(prompt):
+                logger.debug("Prompt still exceeds max_prompt_tokens after summarizing")
         
         return prompt
     
-    def _build_bundle_optimization_prompt(self, simulations: List[SimulationResult]) -> str:
-        """Build bundle optimization prompt."""
-        prompt = "Optimize this transaction bundle for HyperEVM:\n\n"
+    def _exceeds_prompt_budget(self, prompt: str) -> bool:
+        """Check a prompt against ``config.max_prompt_tokens``.
+        
+        Tokens are counted with tiktoken when it is installed; without it, or
+        with no budget configured, the check always passes.
+        
+        Args:
+            prompt: Prompt text to measure
+            
+        Returns:
+            bool: True if the prompt is known to exceed the budget
+        """
+        if self.config.max_prompt_tokens is None:
+            return False
+        
+        if self._enc is None:
+            try:
+                import tiktoken
+            except ImportError:
+                self._enc = False
+            else:
+                try:
+                    self._enc = tiktoken.encoding_for_model(self.config.model.value)
+                except KeyError:
+                    self._enc = tiktoken.get_encoding("cl100k_base")
+        
+        if self._enc is False:
+            return False
+        
+        return len(self._enc.encode(prompt)) > self.config.max_prompt_tokens
+    
+    def _build_bundle_optimization_prompt(self, simulations: List[SimulationResult]) -> Tuple[str, int]:
+        """Build bundle optimization prompt.
+        
+        Returns:
+            Tuple of the prompt and the bundle's total gas, summed in the
+            same pass so callers need not iterate the simulations again
+        """
+        parts: List[str] = ["Optimize this transaction bundle for HyperEVM:", ""]
+        total_gas = 0
         
         for i, sim in enumerate(simulations):
-            prompt += f"Transaction {i}:\n"
-            prompt += f"- Success: {sim.success}\n"
-            prompt += f"- Gas Used: {sim.gas_used}\n"
-            prompt += f"- Block Type: {sim.block_type}\n"
+            total_gas += int(sim.gas_used)
+            parts.append(f"Transaction {i}:")
+            parts.append(f"- Success: {sim.success}")
+            parts.append(f"- Gas Used: {sim.gas_used}")
+            parts.append(f"- Block Type: {sim.block_type}")
             if sim.error:
-                prompt += f"- Error: {sim.error}\n"
-            prompt += "\n"
+                parts.append(f"- Error: {sim.error}")
+            parts.append("")
         
-        total_gas = sum(int(sim.gas_used) for sim in simulations)
-        prompt += f"Total Gas: {total_gas}\n\n"
-        
-        prompt += """Provide optimization suggestions including:
-1. Optimal transaction ordering
-2. Gas savings opportunities
-3. Block type considerations
-4. Bundle-specific recommendations"""
+        parts.append(f"Total Gas: {total_gas}")
+        parts.append("")
+        parts.append(_BUNDLE_PROMPT_FOOTER)
         
-        return prompt
+        return "\n".join(parts), total_gas
     
     def _build_security_analysis_prompt(self, simulation: SimulationResult) -> str:
         """Build security analysis prompt."""
-        prompt = f"""Perform security analysis for this HyperEVM transaction:
-
-- Success: {simulation.success}
-- Gas Used: {simulation.gas_used}"""
+        parts: List[str] = [
+            "Perform security analysis for this HyperEVM transaction:",
+            "",
+            f"- Success: {simulation.success}",
+            f"- Gas Used: {simulation.gas_used}",
+        ]
         
         if simulation.state_changes:
-            prompt += f"\n- State Changes: {len(simulation.state_changes)}"
+            parts.append(f"- State Changes: {len(simulation.state_changes)}")
         
         if simulation.events:
-            prompt += f"\n- Events: {len(simulation.events)}"
+            parts.append(f"- Events: {len(simulation.events)}")
         
         if simulation.error:
-            prompt += f"\n- Error: {simulation.error}"
+            parts.append(f"- Error: {simulation.error}")
         
-        prompt += "\n\nIdentify potential security risks and vulnerabilities."
+        parts.append("")
+        parts.append("Identify potential security risks and vulnerabilities.")
         
-        return prompt
+        return "\n".join(parts)
     
     def _get_system_prompt(self) -> str:
         """Get system prompt for AI analysis."""
-        return """You are an expert blockchain transaction analyzer specializing in HyperEVM.
-
-HyperEVM Context:
-- Dual-block system: Small blocks (2M gas, 1s) and Large blocks (30M gas, 1min)
-- Cross-layer integration with HyperCore trading system
-- EIP-1559 fee mechanism with complete fee burning
-- Precompiled contracts for core interactions
-
-Provide analysis in JSON format with these fields:
-{
-  "riskLevel": "LOW|MEDIUM|HIGH",
-  "gasOptimization": {
-    "potentialSavings": "amount in gas",
-    "techniques": [{
-      "name": "",
-      "description": "",
-      "estimatedSavings": "",
-      "difficulty": "EASY|MEDIUM|HARD"
-    }]
-  },
-  "securityWarnings": ["warning1", "warning2"],
-  "performanceSuggestions": ["suggestion1", "suggestion2"],
-  "explanation": "detailed analysis",
-  "confidence": 0.95,
-  "recommendations": ["action1", "action2"]
-}"""
+        return _SYSTEM_PROMPT
     
     def _get_bundle_optimization_system_prompt(self) -> str:
         """Get system prompt for bundle optimization."""
-        return """You are an expert at optimizing transaction bundles for HyperEVM.
-
-Provide optimization in JSON format:
-{
-  "reorderedIndices": [0, 2, 1],
-  "gasSavings": "estimated savings in gas",
-  "suggestions": ["suggestion1", "suggestion2"],
-  "warnings": ["warning1", "warning2"],
-  "confidence": 0.85
-}"""
+        return _BUNDLE_SYSTEM_PROMPT
     
     def _get_security_analysis_system_prompt(self) -> str:
         """Get system prompt for security analysis."""
-        return """You are a blockchain security expert analyzing HyperEVM transactions.
-
-Provide security analysis in JSON format:
-{
-  "riskLevel": "LOW|MEDIUM|HIGH|CRITICAL",
-  "vulnerabilities": [{
-    "name": "",
-    "severity": "LOW|MEDIUM|HIGH|CRITICAL",
-    "description": "",
-    "impact": "",
-    "recommendation": ""
-  }],
-  "warnings": ["warning1", "warning2"],
-  "recommendations": ["rec1", "rec2"]
-}"""
+        return _SECURITY_SYSTEM_PROMPT
     
     def _parse_ai_response(self, analysis: Dict[str, Any], simulation: SimulationResult) -> AIInsights:
         """Parse AI response into AIInsights."""
-        # Parse gas optimization
-        gas_opt_data = analysis.get("gasOptimization", {})
-        techniques = []
-        
-        for tech_data in gas_opt_data.get("techniques", []):
-            technique = OptimizationTechnique(
-                name=tech_data.get("name", "Unknown"),
-                description=tech_data.get("description", ""),
-                estimated_savings=tech_data.get("estimatedSavings", "0"),
-                difficulty=OptimizationDifficulty(tech_data.get("difficulty", "MEDIUM"))
+        # Fill missing fields in one merge; a non-object reply raises TypeError
+        analysis = {**_INSIGHTS_DEFAULTS, **analysis}
+        gas_opt_data = {**_GAS_OPTIMIZATION_DEFAULTS, **analysis["gasOptimization"]}
+        techniques = [
+            OptimizationTechnique(
+                name=tech_data["name"],
+                description=tech_data["description"],
+                estimated_savings=tech_data["estimatedSavings"],
+                difficulty=_DIFF_MAP.get(tech_data["difficulty"], _DEFAULT_DIFF)
             )
-            techniques.append(technique)
+            for tech_data in (
+                {**_TECHNIQUE_DEFAULTS, **tech} for tech in gas_opt_data["techniques"]
+            )
+        ]
         
         gas_optimization = GasOptimization(
-            potential_savings=gas_opt_data.get("potentialSavings", "0"),
+            potential_savings=gas_opt_data["potentialSavings"],
             techniques=techniques
         )
         
-        # Parse risk level
-        try:
-            risk_level = RiskLevel(analysis.get("riskLevel", "MEDIUM"))
-        except ValueError:
-            risk_level = RiskLevel.MEDIUM
-        
         return AIInsights(
-            risk_level=risk_level,
+            risk_level=_RISK_MAP.get(analysis["riskLevel"], _DEFAULT_RISK),
             gas_optimization=gas_optimization,
-            security_warnings=analysis.get("securityWarnings", []),
-            performance_suggestions=analysis.get("performanceSuggestions", []),
-            explanation=analysis.get("explanation", "Analysis completed"),
-            confidence=analysis.get("confidence", 0.8),
-            recommendations=analysis.get("recommendations", [])
+            security_warnings=analysis["securityWarnings"],
+            performance_suggestions=analysis["performanceSuggestions"],
+            explanation=analysis["explanation"],
+            confidence=analysis["confidence"],
+            recommendations=analysis["recommendations"]
         )
     
-    def _parse_bundle_optimization(self, optimization: Dict[str, Any], simulations: List[SimulationResult]) -> BundleOptimization:
+    def _parse_bundle_optimization(
+        self,
+        optimization: Dict[str, Any],
+        simulations: List[SimulationResult],
+        total_gas: int
+    ) -> BundleOptimization:
         """Parse bundle optimization response."""
-        total_gas = sum(int(sim.gas_used) for sim in simulations)
-        gas_saved = int(optimization.get("gasSavings", "0").replace(" gas", "").replace(",", "") or "0")
+        optimization = {**_BUNDLE_DEFAULTS, **optimization}
+        match = _GAS_RE.search(str(optimization["gasSavings"]))
+        gas_saved = int(match.group().replace(",", "")) if match else 0
         
         return BundleOptimization(
             original_gas=str(total_gas),
             optimized_gas=str(max(0, total_gas - gas_saved)),
             gas_saved=str(gas_saved),
-            suggestions=optimization.get("suggestions", []),
+            suggestions=optimization["suggestions"],
             reordered_indices=optimization.get("reorderedIndices", list(range(len(simulations)))),
-            warnings=optimization.get("warnings"),
-            confidence=optimization.get("confidence")
+            warnings=optimization["warnings"],
+            confidence=optimization["confidence"]
         )
     
+    async def __aenter__(self) -> "AIAnalyzer":
+        """Enter async context manager."""
+        return self
+    
+    async def __aexit__(self, *exc_info: Any) -> None:
+        """Exit async context manager, closing the OpenAI client."""
+        await self.close()
+    
     async def close(self) -> None:
-        """Close the AI analyzer and cleanup resources."""
+        """Close the AI analyzer and cleanup resources.
+        
+        Safe to call more than once; later calls are no-ops.
+        """
+        if self._closed:
+            return
+        
+        self._closed = True
         await self.client.close()
         
-        if self.config.debug:
-            print("[AI Analyzer] Closed")
+        logger.debug("Closed")
+
+
+def get_shared_analyzer(config: AIConfig) -> AIAnalyzer:
+    """Get a process-wide AIAnalyzer for the given API key and model.
+    
+    Analyzers are memoized by ``(api_key, model)`` so repeated callers reuse
+    one OpenAI client and its pooled connections instead of paying a new
+    TCP/TLS handshake each time. The first config seen for a key wins; a
+    shared analyzer that has been closed is replaced on the next call.
+    
+    Args:
+        config: AI configuration
+        
+    Returns:
+        AIAnalyzer: Shared analyzer instance
+    """
+    key = (config.api_key, str(config.model))
+    with _ANALYZERS_LOCK:
+        analyzer = _ANALYZERS.get(key)
+        if analyzer is None or analyzer._closed:
+            analyzer = AIAnalyzer(config)
+            _ANALYZERS[key] = analyzer
+        return analyzer
@@ -3,14 +3,25 @@ Asynchronous API client for HTTP requests using httpx.
 """
 
 import asyncio
-import json
+import importlib.util
+import itertools
 import logging
-from typing import Any, Dict, Optional, List, Union
+import math
+import random
+import re
+import socket
+import time
+from collections import OrderedDict, deque
+from email.utils import parsedate_to_datetime
+from functools import lru_cache, partial
+from typing import Any, Deque, Dict, Iterable, NamedTuple, Optional, List, Sequence, Set, Tuple, Union
 from urllib.parse import urljoin, urlparse
+import httpcore
 import httpx
 from pydantic import ValidationError as PydanticValidationError
 
 from ..types.common import RequestOptions, Response, ErrorContext, RetryConfig
+from ..utils.serialization import json_loads, json_dumps_bytes
 from ..exceptions import (
     NetworkError, APIError, TimeoutError, ValidationError,
     RateLimitError, AuthenticationError
@@ -19,6 +30,256 @@ from ..exceptions import (
 
 logger = logging.getLogger(__name__)
 
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Dedicated generator for retry jitter, separate from the global random state
+_jitter_rng = random.Random()
+
+# Shared params for RPC calls without arguments; serializes as []
+_EMPTY_PARAMS: Tuple[Any, ...] = ()
+
+# max-age directive of a Cache-Control header
+_MAX_AGE_RE = re.compile(r"max-age=(\d+)")
+
+# Responses per host considered when measuring the recent 429 rate
+_CONGESTION_WINDOW = 64
+
+# Seconds after which a response no longer counts towards congestion
+_CONGESTION_MAX_AGE = 60.0
+
+
+@lru_cache(maxsize=512)
+def _build_url_cached(base_url: str, endpoint: str) -> str:
+    """Join base URL and endpoint; memoized since endpoints repeat."""
+    if endpoint.startswith(('http://', 'https://')):
+        return endpoint
+    return urljoin(f"{base_url}/", endpoint.lstrip('/'))
+
+
+class _DNSCachingBackend(httpcore.AsyncNetworkBackend):
+    """httpcore network backend that caches hostname resolution.
+    
+    Only the TCP connect target is swapped for the cached address; TLS still
+    uses the original hostname for SNI and certificate checks, and the Host
+    header comes from the request URL. Every resolved address is cached and
+    tried in turn, and the one that connects is moved to the front, so an
+    unreachable first record (e.g. broken IPv6) costs one failed attempt
+    per TTL rather than every connection.
+    """
+    
+    def __init__(self, backend: httpcore.AsyncNetworkBackend, ttl: float):
+        self._backend = backend
+        self._ttl = ttl
+        self._cache: Dict[Tuple[str, int], Tuple[List[str], float]] = {}
+        
+    async def _resolve(self, host: str, port: int) -> List[str]:
+        """Resolve host to its addresses, reusing results until they expire."""
+        key = (host, port)
+        now = time.monotonic()
+        cached = self._cache.get(key)
+        if cached is not None and cached[1] > now:
+            return cached[0]
+            
+        try:
+            infos = await asyncio.get_running_loop().getaddrinfo(
+                host, port, type=socket.SOCK_STREAM
+            )
+        except socket.gaierror as e:
+            raise httpcore.ConnectError(str(e)) from e
+            
+        # Keep resolver order, dropping duplicates from multiple protocols
+        addresses = list(dict.fromkeys(info[4][0] for info in infos))
+        self._cache[key] = (addresses, now + self._ttl)
+        return addresses
+        
+    async def connect_tcp(
+        self,
+        host: str,
+        port: int,
+        timeout: Optional[float] = None,
+        local_address: Optional[str] = None,
+        socket_options: Optional[Any] = None,
+    ) -> httpcore.AsyncNetworkStream:
+        addresses = await self._resolve(host, port)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        last_error: Optional[Exception] = None
+        
+        for address in list(addresses):
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                break
+            try:
+                stream = await self._backend.connect_tcp(
+                    address,
+                    port,
+                    timeout=remaining,
+                    local_address=local_address,
+                    socket_options=socket_options,
+                )
+            except Exception as e:
+                last_error = e
+                continue
+            
+            # Prefer the address that worked for later connections
+            if address != addresses[0] and address in addresses:
+                addresses.remove(address)
+                addresses.insert(0, address)
+            return stream
+        
+        # The host may have moved; resolve afresh on the next attempt
+        self._cache.pop((host, port), None)
+        if last_error is None:
+            raise httpcore.ConnectTimeout(f"Timed out connecting to {host}:{port}")
+        raise last_error
+            
+    async def connect_unix_socket(
+        self,
+        path: str,
+        timeout: Optional[float] = None,
+        socket_options: Optional[Any] = None,
+    ) -> httpcore.AsyncNetworkStream:
+        return await self._backend.connect_unix_socket(
+            path, timeout=timeout, socket_options=socket_options
+        )
+        
+    async def sleep(self, seconds: float) -> None:
+        await self._backend.sleep(seconds)
+
+
+class _CongestionState:
+    """Recent rate-limit pressure on one host, used to pace requests.
+    
+    Tracks whether each of the last ``_CONGESTION_WINDOW`` responses was a
+    429. While any are in the window, new requests are delayed in
+    proportion to the 429 rate, so concurrent callers back off together
+    instead of each rediscovering the limit; the delay shrinks as
+    successes push throttled responses out of the window. Responses older
+    than ``_CONGESTION_MAX_AGE`` seconds expire, so a host that has been
+    idle since it was rate limiting isn't paced on return.
+    """
+    
+    __slots__ = ("_outcomes", "_throttled", "_consecutive")
+    
+    def __init__(self):
+        # (monotonic time, was_throttled), oldest first
+        self._outcomes: Deque[Tuple[float, bool]] = deque()
+        self._throttled = 0
+        self._consecutive = 0
+        
+    def _expire(self, now: float) -> None:
+        """Drop outcomes that are too old or beyond the window."""
+        outcomes = self._outcomes
+        cutoff = now - _CONGESTION_MAX_AGE
+        while outcomes and (len(outcomes) > _CONGESTION_WINDOW or outcomes[0][0] < cutoff):
+            if outcomes.popleft()[1]:
+                self._throttled -= 1
+        if not outcomes:
+            self._consecutive = 0
+            
+    def record(self, throttled: bool) -> None:
+        """Record whether a response was rate limited."""
+        now = time.monotonic()
+        self._expire(now)
+        self._outcomes.append((now, throttled))
+        
+        if throttled:
+            self._throttled += 1
+            self._consecutive += 1
+        else:
+            self._consecutive = 0
+        
+        if len(self._outcomes) > _CONGESTION_WINDOW:
+            self._expire(now)
+            
+    def recommended_delay(self, base_delay: float, max_delay: float) -> float:
+        """Delay to apply before sending a new request."""
+        if not self._throttled:
+            return 0.0
+        self._expire(time.monotonic())
+        if not self._throttled:
+            return 0.0
+        # Treat a short history as padded with successes so a couple of
+        # early 429s don't jump straight to the maximum delay
+        rate = self._throttled / max(len(self._outcomes), 8)
+        if rate >= 1.0:
+            return max_delay
+        return min(base_delay * rate / (1.0 - rate), max_delay)
+        
+    def dynamic_backoff(self, base_delay: float, max_delay: float) -> float:
+        """Wait after a 429, doubling with each consecutive one."""
+        return min(base_delay * 2 ** min(self._consecutive, 16), max_delay)
+
+
+_CONGESTION: Dict[str, _CongestionState] = {}
+
+
+def _congestion_for(url: str) -> _CongestionState:
+    """Get the congestion state shared by all clients talking to a host."""
+    host = urlparse(url).netloc
+    state = _CONGESTION.get(host)
+    if state is None:
+        state = _CONGESTION[host] = _CongestionState()
+    return state
+
+
+class RPCError(NamedTuple):
+    """Error entry in a JSON-RPC batch result.
+    
+    Kept as a plain tuple so a partially failed batch doesn't allocate an
+    exception per failure; call :meth:`to_exception` to raise one.
+    """
+    
+    message: str
+    code: int
+    data: Any = None
+    
+    def to_exception(self, context: Optional[ErrorContext] = None) -> APIError:
+        """Build the APIError equivalent of this RPC error."""
+        return APIError(f"RPC error: {self.message}", self.code, context, self.data)
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[int]:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP-date)."""
+    if not value:
+        return None
+    try:
+        return max(0, math.ceil(float(value)))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0, math.ceil(retry_at.timestamp() - time.time()))
+
+
+def _build_batch_body(calls: Iterable[Tuple[int, str, Sequence[Any]]]) -> List[Dict[str, Any]]:
+    """Build JSON-RPC envelopes for (id, method, params) triples."""
+    return [
+        {'jsonrpc': '2.0', 'id': request_id, 'method': method, 'params': params}
+        for request_id, method, params in calls
+    ]
+
+
+def _parse_batch_response(content: bytes) -> Dict[Any, Dict[str, Any]]:
+    """Decode a JSON-RPC batch response into responses keyed by id.
+    
+    Servers may answer batch entries in any order, so callers look results
+    up by id rather than by position.
+    """
+    batch_response = json_loads(content)
+    if not isinstance(batch_response, list):
+        batch_response = [batch_response]
+    return {rpc_response.get('id'): rpc_response for rpc_response in batch_response}
+
+
+def _dns_caching_transport(ttl: float, **kwargs) -> httpx.AsyncHTTPTransport:
+    """Build an httpx transport whose connection pool caches DNS lookups."""
+    transport = httpx.AsyncHTTPTransport(**kwargs)
+    pool = transport._pool
+    pool._network_backend = _DNSCachingBackend(pool._network_backend, ttl)
+    return transport
+
 
 class HTTPClient:
     """Asynchronous HTTP client with retry logic, rate limiting, and error handling."""
@@ -29,6 +290,13 @@ class HTTPClient:
         timeout: float = 30.0,
         retry_config: Optional[RetryConfig] = None,
         headers: Optional[Dict[str, str]] = None,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 300.0,
+        http2: bool = True,
+        dns_cache_ttl: Optional[float] = 300.0,
+        response_cache_size: int = 256,
+        prewarm: int = 0,
         **kwargs
     ):
         """Initialize HTTP client.
@@ -38,17 +306,25 @@ class HTTPClient:
             timeout: Request timeout in seconds
             retry_config: Retry configuration
             headers: Default headers for requests
+            max_connections: Maximum concurrent connections in the pool
+            max_keepalive_connections: Idle connections kept open for reuse
+            keepalive_expiry: Seconds an idle connection is kept alive
+            http2: Negotiate HTTP/2 when the ``h2`` package is installed
+            dns_cache_ttl: Seconds to reuse a resolved hostname for new
+                connections; None resolves on every connect
+            response_cache_size: Max responses kept for requests made with
+                ``options.cache_ttl``
+            prewarm: Connections to open when the client is created; when
+                non-zero they are also kept from idling out with periodic
+                HEAD requests
             **kwargs: Additional httpx client arguments
         """
         self.base_url = base_url.rstrip('/')
         self.timeout = timeout
-        self.retry_config = retry_config or RetryConfig(
-            maxAttempts=3,
-            baseDelay=1000,
-            maxDelay=30000,
-            backoffMultiplier=2.0,
-            jitter=True
-        )
+        self.retry_config = retry_config or RetryConfig()
+        self._base_delay = self.retry_config.initial_delay
+        self._max_delay = self.retry_config.max_delay
+        self._delay_schedule = self._build_delay_schedule(self.retry_config.max_attempts)
         
         # Default headers
         default_headers = {
@@ -59,16 +335,43 @@ class HTTPClient:
         if headers:
             default_headers.update(headers)
             
+        limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry
+        )
+        http2 = http2 and _HTTP2_AVAILABLE
+        
         # HTTP client configuration
         client_config = {
             'timeout': httpx.Timeout(timeout),
             'headers': default_headers,
             'follow_redirects': True,
+            'limits': limits,
+            'http2': http2,
             **kwargs
         }
         
+        # httpx ignores limits/http2/verify when given a transport, so the
+        # DNS-caching transport must carry them itself
+        if dns_cache_ttl and 'transport' not in kwargs:
+            transport_options = {
+                key: kwargs[key] for key in ('verify', 'cert', 'trust_env') if key in kwargs
+            }
+            client_config['transport'] = _dns_caching_transport(
+                dns_cache_ttl, limits=limits, http2=http2, **transport_options
+            )
+        
         self._client: Optional[httpx.AsyncClient] = None
         self._client_config = client_config
+        # Identical requests currently in flight, awaited by later callers
+        self._inflight: Dict[Tuple[Any, ...], asyncio.Task] = {}
+        # Parsed responses for requests made with options.cache_ttl
+        self._response_cache: OrderedDict[Tuple[Any, ...], Tuple[float, Response[Any]]] = OrderedDict()
+        self._response_cache_size = response_cache_size
+        self._prewarm = prewarm
+        self._keepalive_expiry = keepalive_expiry
+        self._keepalive_task: Optional[asyncio.Task] = None
         
     async def __aenter__(self) -> 'HTTPClient':
         """Async context manager entry."""
@@ -79,53 +382,100 @@ class HTTPClient:
         """Async context manager exit."""
         await self.close()
         
+    def _build_delay_schedule(self, attempts: int) -> Tuple[float, ...]:
+        """Precompute capped retry delays in seconds, before jitter."""
+        multiplier = self.retry_config.backoff_multiplier
+        return tuple(
+            min(self._base_delay * multiplier ** i, self._max_delay) for i in range(attempts)
+        )
+        
     async def _ensure_client(self) -> httpx.AsyncClient:
-        """Ensure HTTP client is initialized."""
+        """Ensure HTTP client is initialized.
+        
+        The client is created once and reused, so every request (including
+        JSON-RPC calls and batches) shares its keep-alive connection pool.
+        """
         if self._client is None:
             self._client = httpx.AsyncClient(**self._client_config)
+            if self._prewarm:
+                await self._warm_connections(self._client)
+                self._keepalive_task = asyncio.create_task(self._keep_connections_alive())
         return self._client
         
+    async def _warm_connections(self, client: httpx.AsyncClient) -> None:
+        """Open pooled connections with cheap HEAD requests; errors are ignored."""
+        await asyncio.gather(
+            *(client.head(self.base_url) for _ in range(self._prewarm)),
+            return_exceptions=True
+        )
+        
+    async def _keep_connections_alive(self) -> None:
+        """Re-warm the pool before idle connections reach keepalive expiry."""
+        while self._client is not None:
+            await asyncio.sleep(self._keepalive_expiry / 2)
+            if self._client is not None:
+                await self._warm_connections(self._client)
+                
     async def close(self):
         """Close HTTP client."""
+        if self._keepalive_task is not None:
+            self._keepalive_task.cancel()
+            self._keepalive_task = None
         if self._client:
             await self._client.aclose()
             self._client = None
             
     def _build_url(self, endpoint: str) -> str:
         """Build full URL from endpoint."""
-        if endpoint.startswith(('http://', 'https://')):
-            return endpoint
-        return urljoin(f"{self.base_url}/", endpoint.lstrip('/'))
+        return _build_url_cached(self.base_url, endpoint)
         
     def _handle_response_status(
         self, 
         response: httpx.Response,
-        context: ErrorContext
+        context: ErrorContext,
+        congestion: Optional[_CongestionState] = None
     ) -> None:
-        """Handle HTTP response status codes."""
+        """Handle HTTP response status codes.
+        
+        Args:
+            response: Response to check
+            context: Error context for raised exceptions
+            congestion: Host congestion state to feed the outcome into
+        """
+        if congestion is not None:
+            congestion.record(response.status_code == 429)
+            
+        # Nearly every response succeeds; skip the error cascade for them
+        if response.status_code < 400:
+            return
+            
         if response.status_code == 429:
-            retry_after = response.headers.get('Retry-After', '60')
+            retry_after = _parse_retry_after(response.headers.get('Retry-After'))
+            message = (
+                f"Rate limit exceeded. Retry after {retry_after} seconds"
+                if retry_after is not None else "Rate limit exceeded"
+            )
             raise RateLimitError(
-                f"Rate limit exceeded. Retry after {retry_after} seconds",
-                int(retry_after),
-                context
+                message, retry_after=retry_after, context=context, status_code=429
             )
         elif response.status_code == 401:
-            raise AuthenticationError("Authentication failed", context)
+            raise AuthenticationError("Authentication failed", 401, context, response.content)
         elif response.status_code == 403:
-            raise AuthenticationError("Access forbidden", context)
-        elif response.status_code >= 400:
+            raise AuthenticationError("Access forbidden", 403, context, response.content)
+        else:
             try:
-                error_data = response.json()
+                error_data = json_loads(response.content)
                 message = error_data.get('message', f"HTTP {response.status_code}")
-            except:
+            except (ValueError, AttributeError):
+                # Not JSON (JSONDecodeError is a ValueError) or not an object
                 message = f"HTTP {response.status_code}: {response.reason_phrase}"
                 
+            # Raw bytes; APIError decodes them only if the body is read
             raise APIError(
                 message,
                 response.status_code,
                 context,
-                response.text
+                response.content
             )
             
     async def _make_request_with_retry(
@@ -146,32 +496,49 @@ class HTTPClient:
             'timeout': options.timeout or self.timeout,
         }
         
-        # Add headers
+        # Per-request headers; httpx merges them over the client defaults
         if options.headers:
-            headers = dict(client.headers)
-            headers.update(options.headers)
-            request_params['headers'] = headers
+            request_params['headers'] = options.headers
+            
+        # Let httpx encode query parameters, keeping any already in the URL
+        # (a plain params= argument would replace them)
+        if options.params:
+            request_params['url'] = httpx.URL(url).copy_merge_params(options.params)
             
         # Add body/data
         if options.body is not None:
             if isinstance(options.body, (dict, list)):
-                request_params['json'] = options.body
+                # Serialized here (orjson when installed); the client's default
+                # headers already declare Content-Type: application/json
+                request_params['content'] = json_dumps_bytes(options.body)
             else:
                 request_params['content'] = options.body
                 
+        congestion = _congestion_for(url)
         max_attempts = options.retries or self.retry_config.max_attempts
-        base_delay = self.retry_config.base_delay / 1000.0  # Convert to seconds
-        max_delay = self.retry_config.max_delay / 1000.0
+        delay_schedule = self._delay_schedule
+        if max_attempts > len(delay_schedule):
+            delay_schedule = self._build_delay_schedule(max_attempts)
         
         last_exception: Optional[Exception] = None
+        # Set after sleeping out a 429 so the next attempt doesn't pace again
+        backed_off = False
         
         for attempt in range(1, max_attempts + 1):
             try:
                 context.retry_attempt = attempt
                 logger.debug(f"Making {method} request to {url} (attempt {attempt})")
                 
+                # Pace proactively while the host has been rate limiting
+                if backed_off:
+                    backed_off = False
+                else:
+                    pacing = congestion.recommended_delay(self._base_delay, self._max_delay)
+                    if pacing:
+                        await asyncio.sleep(pacing)
+                    
                 response = await client.request(**request_params)
-                self._handle_response_status(response, context)
+                self._handle_response_status(response, context, congestion)
                 
                 logger.debug(f"Request successful: {response.status_code}")
                 return response
@@ -201,7 +568,12 @@ class HTTPClient:
                 # Don't retry on client errors (except rate limiting)
                 if isinstance(e, RateLimitError):
                     if attempt < max_attempts:
-                        await asyncio.sleep(e.retry_after)
+                        # Retry-After is a floor; back off further under sustained 429s
+                        await asyncio.sleep(max(
+                            e.retry_after or 0,
+                            congestion.dynamic_backoff(self._base_delay, self._max_delay)
+                        ))
+                        backed_off = True
                         continue
                 raise e
                 
@@ -215,14 +587,10 @@ class HTTPClient:
                 
             # Calculate delay for next retry
             if attempt < max_attempts:
-                delay = min(
-                    base_delay * (self.retry_config.backoff_multiplier ** (attempt - 1)),
-                    max_delay
-                )
+                delay = delay_schedule[attempt - 1]
                 
                 if self.retry_config.jitter:
-                    import random
-                    delay *= (0.5 + random.random() * 0.5)
+                    delay *= 0.5 + _jitter_rng.random() * 0.5
                     
                 logger.debug(f"Retrying in {delay:.2f}s")
                 await asyncio.sleep(delay)
@@ -241,6 +609,12 @@ class HTTPClient:
     ) -> Response[Any]:
         """Make HTTP request.
         
+        GET and HEAD requests (or any request with ``options.dedupe``) that
+        match one already in flight await its result instead of sending a
+        duplicate. With ``options.cache_ttl`` set, the parsed Response is
+        cached and shared by identical requests until it expires (or for the
+        server's ``Cache-Control: max-age``); treat it as read-only.
+        
         Args:
             method: HTTP method
             endpoint: API endpoint
@@ -251,9 +625,93 @@ class HTTPClient:
         """
         options = options or RequestOptions()
         
+        key: Optional[Tuple[Any, ...]] = None
+        if options.cache_ttl:
+            key = self._request_key(method, endpoint, options)
+            cached = self._response_cache.get(key)
+            if cached is not None:
+                if cached[0] > time.monotonic():
+                    self._response_cache.move_to_end(key)
+                    return cached[1]
+                del self._response_cache[key]
+                
+        dedupe = options.dedupe
+        if dedupe is None:
+            dedupe = method.upper() in ('GET', 'HEAD')
+        if not dedupe:
+            response = await self._send_request(method, endpoint, options)
+        else:
+            response = await self._send_deduped(
+                key or self._request_key(method, endpoint, options), method, endpoint, options
+            )
+            
+        if key is not None:
+            self._cache_response(key, response, options.cache_ttl)
+        return response
+        
+    async def _send_deduped(
+        self,
+        key: Tuple[Any, ...],
+        method: str,
+        endpoint: str,
+        options: RequestOptions
+    ) -> Response[Any]:
+        """Send a request, or join an identical one already in flight."""
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._send_request(method, endpoint, options))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+            
+        # Shielded so one caller cancelling doesn't cancel the others' request
+        return await asyncio.shield(task)
+        
+    def _cache_response(self, key: Tuple[Any, ...], response: Response[Any], ttl: float) -> None:
+        """Store a parsed response, honouring the server's Cache-Control."""
+        cache_control = response.headers.get('cache-control')
+        if cache_control:
+            if 'no-store' in cache_control or 'no-cache' in cache_control:
+                return
+            match = _MAX_AGE_RE.search(cache_control)
+            if match:
+                ttl = float(match.group(1))
+                
+        if ttl <= 0:
+            return
+            
+        self._response_cache[key] = (time.monotonic() + ttl, response)
+        self._response_cache.move_to_end(key)
+        if len(self._response_cache) > self._response_cache_size:
+            self._response_cache.popitem(last=False)
+            
+    def _request_key(
+        self,
+        method: str,
+        endpoint: str,
+        options: RequestOptions
+    ) -> Tuple[Any, ...]:
+        """Key identifying requests that would produce the same response."""
+        body = options.body
+        if isinstance(body, (dict, list)):
+            body = json_dumps_bytes(body)
+        return (
+            method.upper(),
+            self._build_url(endpoint),
+            json_dumps_bytes(options.params) if options.params else None,
+            tuple(sorted(options.headers.items())) if options.headers else None,
+            body,
+        )
+        
+    async def _send_request(
+        self,
+        method: str,
+        endpoint: str,
+        options: RequestOptions
+    ) -> Response[Any]:
+        """Send a request and wrap the parsed result in a Response."""
         context = ErrorContext(
             operation=f"{method.upper()} {endpoint}",
-            timestamp=int(asyncio.get_event_loop().time() * 1000),
+            timestamp=time.monotonic_ns() // 1_000_000,
         )
         
         try:
@@ -262,7 +720,7 @@ class HTTPClient:
             # Parse response data
             try:
                 if response.headers.get('content-type', '').startswith('application/json'):
-                    data = response.json()
+                    data = json_loads(response.content)
                 else:
                     data = response.text
             except Exception as e:
@@ -299,11 +757,10 @@ class HTTPClient:
         options = options or RequestOptions()
         
         if params:
-            # Add query parameters to URL
-            import urllib.parse
-            query_string = urllib.parse.urlencode(params)
-            separator = '&' if '?' in endpoint else '?'
-            endpoint = f"{endpoint}{separator}{query_string}"
+            # Copy so a caller's reused options never carry this call's query
+            options = options.model_copy(
+                update={"params": {**(options.params or {}), **params}}
+            )
             
         return await self.request('GET', endpoint, options)
         
@@ -367,15 +824,44 @@ class HTTPClient:
 class JSONRPCClient(HTTPClient):
     """JSON-RPC client built on top of HTTPClient."""
     
-    def __init__(self, rpc_url: str, **kwargs):
+    def __init__(
+        self,
+        rpc_url: str,
+        micro_batch_ms: Optional[float] = None,
+        max_batch: int = 100,
+        **kwargs
+    ):
         """Initialize JSON-RPC client.
         
         Args:
             rpc_url: JSON-RPC endpoint URL
+            micro_batch_ms: Window in milliseconds during which concurrent
+                ``call()`` invocations are coalesced into one batch POST
+                (typically 1-5); None sends every call on its own
+            max_batch: Maximum calls per coalesced batch POST; a full batch is
+                sent immediately
             **kwargs: Additional HTTPClient arguments
         """
         super().__init__(rpc_url, **kwargs)
-        self._request_id = 1
+        self._id_iter = itertools.count(1)
+        # Every RPC goes to the same URL; resolve it once
+        self._rpc_url = self._build_url('')
+        self._micro_batch_ms = micro_batch_ms
+        self._max_batch = max_batch
+        self._pending: List[Tuple[int, asyncio.Future, str, Sequence[Any]]] = []
+        self._flush_now = asyncio.Event()
+        self._flush_task: Optional[asyncio.Task] = None
+        # Full batches sent ahead of the window; kept referenced until done
+        self._batch_tasks: Set[asyncio.Task] = set()
+        
+    async def close(self):
+        """Flush coalesced calls, then close HTTP client."""
+        if self._flush_task is not None:
+            self._flush_now.set()
+            await self._flush_task
+        if self._batch_tasks:
+            await asyncio.gather(*self._batch_tasks, return_exceptions=True)
+        await super().close()
         
     async def call(
         self,
@@ -396,14 +882,17 @@ class JSONRPCClient(HTTPClient):
             RPC result
         """
         if request_id is None:
-            request_id = self._request_id
-            self._request_id += 1
+            request_id = next(self._id_iter)
+            
+            # Per-call timeouts can't be honoured inside a shared batch
+            if self._micro_batch_ms is not None and timeout is None:
+                return await self._coalesce(request_id, method, params or _EMPTY_PARAMS)
             
         rpc_request = {
             'jsonrpc': '2.0',
             'id': request_id,
             'method': method,
-            'params': params or []
+            'params': params or _EMPTY_PARAMS
         }
         
         options = RequestOptions(
@@ -413,30 +902,151 @@ class JSONRPCClient(HTTPClient):
         
         context = ErrorContext(
             operation=f"RPC {method}",
-            timestamp=int(asyncio.get_event_loop().time() * 1000),
+            timestamp=time.monotonic_ns() // 1_000_000,
             metadata={'method': method, 'params': params}
         )
         
+        # The RPC body is always JSON, so parse the raw bytes directly rather
+        # than going through request()'s content-type sniffing and Response
         try:
-            response = await self._make_request_with_retry('POST', '', options, context)
-            rpc_response = response.json()
+            response = await self._make_request_with_retry('POST', self._rpc_url, options, context)
+            rpc_response = json_loads(response.content)
+        except APIError:
+            raise
+        except Exception as e:
+            raise APIError(f"RPC call failed: {e}", 500, context)
+            
+        if 'error' in rpc_response:
+            error = rpc_response['error']
+            raise APIError(
+                f"RPC error: {error.get('message', 'Unknown error')}",
+                error.get('code', -1),
+                context,
+                error.get('data')
+            )
+            
+        return rpc_response.get('result')
+            
+    async def _coalesce(self, request_id: int, method: str, params: Sequence[Any]) -> Any:
+        """Queue a call for the next coalesced batch and await its result."""
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((request_id, future, method, params))
+        
+        if len(self._pending) >= self._max_batch:
+            # Send a full batch right away; calls made in the same tick would
+            # otherwise pile up past max_batch before the flush task runs
+            chunk, self._pending = self._pending, []
+            task = asyncio.create_task(self._send_batch(chunk))
+            self._batch_tasks.add(task)
+            task.add_done_callback(partial(self._on_batch_done, chunk))
+        elif self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_pending())
+            self._flush_task.add_done_callback(self._on_flush_done)
+            
+        return await future
+        
+    def _on_batch_done(
+        self,
+        pending: List[Tuple[int, asyncio.Future, str, Sequence[Any]]],
+        task: asyncio.Task
+    ) -> None:
+        """Release a full-batch task, failing its calls if it never ran."""
+        self._batch_tasks.discard(task)
+        if task.cancelled():
+            self._fail_pending(pending, "RPC batch cancelled before a response arrived")
             
-            if 'error' in rpc_response:
+    def _on_flush_done(self, task: asyncio.Task) -> None:
+        """Fail calls still queued if the flush task was cancelled in its window."""
+        if task.cancelled() and self._flush_task is task:
+            pending, self._pending = self._pending, []
+            self._flush_task = None
+            self._fail_pending(pending, "RPC batch cancelled before it was sent")
+            
+    async def _flush_pending(self) -> None:
+        """Send calls queued during the batching window as one batch."""
+        try:
+            await asyncio.wait_for(self._flush_now.wait(), self._micro_batch_ms / 1000.0)
+        except asyncio.TimeoutError:
+            pass
+            
+        pending, self._pending = self._pending, []
+        self._flush_now.clear()
+        self._flush_task = None
+        
+        if pending:
+            # New calls now open a fresh window; track this send like a full
+            # batch so close() still waits for it
+            task = asyncio.current_task()
+            self._batch_tasks.add(task)
+            task.add_done_callback(self._batch_tasks.discard)
+            await self._send_batch(pending)
+            
+    def _fail_pending(
+        self,
+        pending: List[Tuple[int, asyncio.Future, str, Sequence[Any]]],
+        message: str
+    ) -> None:
+        """Fail queued calls that will never receive a response."""
+        error = APIError(message, 500)
+        for _, future, _, _ in pending:
+            if not future.done():
+                future.set_exception(error)
+                
+    async def _send_batch(self, pending: List[Tuple[int, asyncio.Future, str, Sequence[Any]]]) -> None:
+        """POST queued calls as one batch and resolve their futures."""
+        try:
+            await self._post_batch(pending)
+        except asyncio.CancelledError:
+            self._fail_pending(pending, "RPC batch cancelled before a response arrived")
+            raise
+            
+    async def _post_batch(self, pending: List[Tuple[int, asyncio.Future, str, Sequence[Any]]]) -> None:
+        """Send one coalesced batch and dispatch each response to its caller."""
+        batch_requests = _build_batch_body(
+            (request_id, method, params) for request_id, _, method, params in pending
+        )
+        
+        context = ErrorContext(
+            operation=f"RPC batch ({len(pending)} calls)",
+            timestamp=time.monotonic_ns() // 1_000_000,
+            metadata={'batch_size': len(pending)}
+        )
+        
+        try:
+            response = await self._make_request_with_retry(
+                'POST', self._rpc_url, RequestOptions(body=batch_requests), context
+            )
+            responses = _parse_batch_response(response.content)
+        except Exception as e:
+            if not isinstance(e, APIError):
+                e = APIError(f"RPC batch call failed: {e}", 500, context)
+            for _, future, _, _ in pending:
+                if not future.done():
+                    future.set_exception(e)
+            return
+            
+        for request_id, future, method, _ in pending:
+            if future.done():
+                continue
+                
+            rpc_response = responses.get(request_id)
+            if rpc_response is None:
+                future.set_exception(APIError(
+                    f"RPC error: no response for {method} (id {request_id})",
+                    -1,
+                    context
+                ))
+            elif 'error' in rpc_response:
                 error = rpc_response['error']
-                raise APIError(
+                future.set_exception(APIError(
                     f"RPC error: {error.get('message', 'Unknown error')}",
                     error.get('code', -1),
                     context,
                     error.get('data')
-                )
+                ))
+            else:
+                future.set_result(rpc_response.get('result'))
                 
-            return rpc_response.get('result')
-            
-        except APIError:
-            raise
-        except Exception as e:
-            raise APIError(f"RPC call failed: {e}", 500, context)
-            
     async def batch(
         self,
         calls: List[Dict[str, Any]],
@@ -449,19 +1059,15 @@ class JSONRPCClient(HTTPClient):
             timeout: Request timeout
             
         Returns:
-            List of RPC results
+            List of RPC results in call order; failed calls appear as
+            RPCError entries
         """
-        batch_requests = []
+        request_ids = list(itertools.islice(self._id_iter, len(calls)))
+        batch_requests = _build_batch_body(
+            (request_id, call['method'], call.get('params') or _EMPTY_PARAMS)
+            for request_id, call in zip(request_ids, calls)
+        )
         
-        for call in calls:
-            batch_requests.append({
-                'jsonrpc': '2.0',
-                'id': self._request_id,
-                'method': call['method'],
-                'params': call.get('params', [])
-            })
-            self._request_id += 1
-            
         options = RequestOptions(
             body=batch_requests,
             timeout=timeout
@@ -469,31 +1075,29 @@ class JSONRPCClient(HTTPClient):
         
         context = ErrorContext(
             operation=f"RPC batch ({len(calls)} calls)",
-            timestamp=int(asyncio.get_event_loop().time() * 1000),
+            timestamp=time.monotonic_ns() // 1_000_000,
             metadata={'batch_size': len(calls)}
         )
         
         try:
-            response = await self._make_request_with_retry('POST', '', options, context)
-            batch_response = response.json()
-            
-            if not isinstance(batch_response, list):
-                batch_response = [batch_response]
-                
-            results = []
-            for rpc_response in batch_response:
-                if 'error' in rpc_response:
-                    error = rpc_response['error']
-                    results.append(APIError(
-                        f"RPC error: {error.get('message', 'Unknown error')}",
-                        error.get('code', -1),
-                        context,
-                        error.get('data')
-                    ))
-                else:
-                    results.append(rpc_response.get('result'))
-                    
-            return results
-            
+            response = await self._make_request_with_retry('POST', self._rpc_url, options, context)
+            responses = _parse_batch_response(response.content)
         except Exception as e:
             raise APIError(f"RPC batch call failed: {e}", 500, context)
+            
+        results = []
+        for request_id in request_ids:
+            rpc_response = responses.get(request_id)
+            if rpc_response is None:
+                results.append(RPCError(f"No response for id {request_id}", -1))
+            elif 'error' in rpc_response:
+                error = rpc_response['error']
+                results.append(RPCError(
+                    error.get('message', 'Unknown error'),
+                    error.get('code', -1),
+                    error.get('data')
+                ))
+            else:
+                results.append(rpc_response.get('result'))
+                
+        return results
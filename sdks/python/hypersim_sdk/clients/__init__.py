@@ -4,10 +4,13 @@ Clients package initialization.
 
 from .hyperevm_client import HyperEVMClient
 from .hypercore_client import HyperCoreClient
-from .websocket_client import WebSocketClient
+from .websocket_client import WebSocketClient, install_uvloop
+from .session import create_shared_session
 
 __all__ = [
     "HyperEVMClient",
     "HyperCoreClient",
-    "WebSocketClient"
+    "WebSocketClient",
+    "create_shared_session",
+    "install_uvloop"
 ]
@@ -3,9 +3,11 @@ HyperCore client for cross-layer integration with AsyncIO.
 """
 
 import asyncio
-from typing import Dict, List, Any, Optional, Union
+import re
+import time
+from types import MappingProxyType
+from typing import Any, Awaitable, Callable, Dict, List, Mapping, Optional, Tuple, Union
 import aiohttp
-import json
 from ..types.network import Network, get_network_config
 from ..types.simulation import (
     TransactionRequest, HyperCoreData, Position, MarketData, 
@@ -14,17 +16,52 @@ from ..types.simulation import (
 from ..types.errors import NetworkError, ValidationError
 from ..utils.constants import HYPERCORE_ENDPOINTS, PRECOMPILE_ADDRESSES
 from ..utils.validators import validate_ethereum_address
+from ..utils.serialization import JSONDecodeError, json_dumps_bytes, json_loads
+from .session import JSON_SESSION_HEADERS, KEEPALIVE_TIMEOUT, READ_BUFSIZE
+
+
+# Cache lifetimes (seconds) for Info API responses reused across simulations
+META_CACHE_TTL = 60.0
+ALL_MIDS_CACHE_TTL = 1.0
+L2_BOOK_CACHE_TTL = 0.5
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Precompile lookups built once at import instead of on every transaction
+_PRECOMPILE_VALUES = frozenset(address.lower() for address in PRECOMPILE_ADDRESSES.values())
+_PRECOMPILE_BY_HEX = {
+    address.lower()[2:]: address for address in PRECOMPILE_ADDRESSES.values()
+}
+# Shortest calldata ("0x" + 40 hex chars) that can embed an address
+_MIN_ADDRESS_CALLDATA_LEN = 42
+# Single-pass multi-pattern scan of calldata; the lookahead reports
+# overlapping occurrences so no address can be shadowed by another
+_PRECOMPILE_RE = re.compile(
+    "(?=(" + "|".join(re.escape(hex_address) for hex_address in _PRECOMPILE_BY_HEX) + "))"
+)
 
 
 class HyperCoreClient:
     """Async client for HyperCore cross-layer interactions."""
     
+    __slots__ = (
+        "network", "config", "timeout", "enabled", "debug",
+        "connection_limit", "per_host_limit", "market_data_budget",
+        "endpoints", "_session", "_owns_session", "_request_semaphore",
+        "_cache", "_cache_locks", "_prefetched"
+    )
+    
     def __init__(
         self,
         network: Network,
         timeout: float = 30.0,
         enabled: bool = True,
-        debug: bool = False
+        debug: bool = False,
+        max_concurrent_requests: int = 10,
+        session: Optional[aiohttp.ClientSession] = None,
+        connection_limit: int = 100,
+        per_host_limit: Optional[int] = None,
+        market_data_budget: Optional[float] = None
     ) -> None:
         """Initialize HyperCore client.
         
@@ -33,18 +70,41 @@ class HyperCoreClient:
             timeout: Request timeout in seconds
             enabled: Whether cross-layer integration is enabled
             debug: Enable debug logging
+            max_concurrent_requests: Cap on concurrent L2 book requests
+            session: Shared session to use; the caller keeps ownership
+            connection_limit: Maximum pooled connections for an owned session
+            per_host_limit: Maximum connections per host; defaults to
+                connection_limit since the Info API is a single host
+            market_data_budget: Seconds to wait for L2 books before returning
+                the depths collected so far (None waits for all)
         """
         self.network = network
         self.config = get_network_config(network)
         self.timeout = timeout
         self.enabled = enabled
         self.debug = debug
+        self.connection_limit = connection_limit
+        self.per_host_limit = per_host_limit or connection_limit
+        self.market_data_budget = market_data_budget
         
         # HyperCore API endpoints
         self.endpoints = HYPERCORE_ENDPOINTS[network]
         
-        # HTTP session for API calls
-        self._session: Optional[aiohttp.ClientSession] = None
+        # HTTP session for API calls; only closed here if we created it
+        self._session: Optional[aiohttp.ClientSession] = session
+        self._owns_session = session is None
+        
+        # Bounds the per-asset L2 book fan-out to avoid rate-limit storms
+        self._request_semaphore = asyncio.Semaphore(max_concurrent_requests)
+        
+        # Short-lived response cache: key -> (expiry, value), with one lock
+        # per key so concurrent misses share a single upstream fetch
+        self._cache: Dict[str, Tuple[float, Any]] = {}
+        self._cache_locks: Dict[str, asyncio.Lock] = {}
+        
+        # In-flight prefetches keyed by transaction identity; the entry holds
+        # the transaction itself so its id cannot be reused while pending
+        self._prefetched: Dict[int, Tuple[TransactionRequest, asyncio.Task]] = {}
         
         if self.debug:
             print(f"[HyperCore Client] Initialized for {network}, enabled: {enabled}")
@@ -58,25 +118,75 @@ class HyperCoreClient:
         """Async context manager exit."""
         await self.close()
     
+    def use_session(self, session: aiohttp.ClientSession) -> None:
+        """Switch to a shared session owned by the caller.
+        
+        Args:
+            session: Session to use; ``close()`` will leave it open
+        """
+        self._session = session
+        self._owns_session = False
+    
     async def _ensure_session(self) -> None:
         """Ensure HTTP session is created."""
+        if not self._owns_session:
+            return
+        
         if self._session is None or self._session.closed:
             timeout = aiohttp.ClientTimeout(total=self.timeout)
-            connector = aiohttp.TCPConnector(limit=100, limit_per_host=30)
+            connector = aiohttp.TCPConnector(
+                limit=self.connection_limit,
+                limit_per_host=self.per_host_limit,
+                ttl_dns_cache=300,
+                keepalive_timeout=KEEPALIVE_TIMEOUT,
+                enable_cleanup_closed=True
+            )
             self._session = aiohttp.ClientSession(
                 timeout=timeout,
                 connector=connector,
-                headers={"Content-Type": "application/json"}
+                headers=JSON_SESSION_HEADERS,
+                read_bufsize=READ_BUFSIZE
             )
     
     async def close(self) -> None:
         """Close the client and cleanup resources."""
-        if self._session and not self._session.closed:
+        for _, task in self._prefetched.values():
+            task.cancel()
+        self._prefetched.clear()
+        
+        if self._owns_session and self._session and not self._session.closed:
             await self._session.close()
         
         if self.debug:
             print("[HyperCore Client] Closed")
     
+    def prefetch(self, transaction: TransactionRequest) -> None:
+        """Start fetching HyperCore data for a transaction in the background.
+        
+        Lets callers overlap HyperCore requests with HyperEVM simulation; the
+        next ``get_relevant_data`` call for the same transaction object awaits
+        the prefetched result instead of issuing new requests. Must be called
+        from within a running event loop.
+        
+        Args:
+            transaction: Transaction that will be analyzed
+        """
+        if not self.enabled or id(transaction) in self._prefetched:
+            return
+        
+        task = asyncio.create_task(self._fetch_relevant_data(transaction))
+        self._prefetched[id(transaction)] = (transaction, task)
+    
+    def cancel_prefetch(self, transaction: TransactionRequest) -> None:
+        """Drop an unused prefetch for a transaction, if one is pending.
+        
+        Args:
+            transaction: Transaction passed to ``prefetch``
+        """
+        entry = self._prefetched.pop(id(transaction), None)
+        if entry is not None:
+            entry[1].cancel()
+    
     async def get_relevant_data(self, transaction: TransactionRequest) -> Optional[HyperCoreData]:
         """Get relevant HyperCore data for a transaction.
         
@@ -89,21 +199,35 @@ class HyperCoreClient:
         if not self.enabled:
             return None
         
+        entry = self._prefetched.pop(id(transaction), None)
+        if entry is not None:
+            return await entry[1]
+        
+        return await self._fetch_relevant_data(transaction)
+    
+    async def _fetch_relevant_data(self, transaction: TransactionRequest) -> Optional[HyperCoreData]:
+        """Fetch HyperCore data for a transaction, returning None on failure."""
         try:
             await self._ensure_session()
             
-            # Fetch user positions if transaction involves a user address
-            positions = await self._get_user_positions(transaction.from_address)
-            
-            # Fetch market data for relevant assets
-            market_data = await self._get_market_data()
+            # Positions, market data and core state are independent requests;
+            # fetch them concurrently instead of paying each round-trip in turn
+            positions, market_data, core_state = await asyncio.gather(
+                self._get_user_positions(transaction.from_address),
+                self._get_market_data(),
+                self._get_core_state(),
+                return_exceptions=True
+            )
+            if isinstance(positions, BaseException):
+                positions = None
+            if isinstance(market_data, BaseException):
+                market_data = None
+            if isinstance(core_state, BaseException):
+                core_state = {}
             
             # Analyze cross-layer interactions
             interactions = self._analyze_cross_layer_interactions(transaction)
             
-            # Get core state information
-            core_state = await self._get_core_state()
-            
             if self.debug:
                 print(f"[HyperCore Client] Retrieved data: {len(positions or [])} positions")
             
@@ -151,15 +275,21 @@ class HyperCoreClient:
     async def get_market_info(self) -> Dict[str, Any]:
         """Get market information from HyperCore.
         
+        Results are cached for ``META_CACHE_TTL`` seconds.
+        
         Returns:
             Dict containing market info
         """
         await self._ensure_session()
         
         try:
-            response = await self._make_request("POST", self.endpoints["info"], {
-                "type": "meta"
-            })
+            response = await self._cached(
+                "meta",
+                lambda: self._make_request("POST", self.endpoints["info"], {
+                    "type": "meta"
+                }),
+                META_CACHE_TTL
+            )
             
             return response
         
@@ -169,15 +299,21 @@ class HyperCoreClient:
     async def get_all_mids(self) -> Dict[str, str]:
         """Get all asset mid prices.
         
+        Results are cached for ``ALL_MIDS_CACHE_TTL`` seconds.
+        
         Returns:
             Dict mapping asset names to mid prices
         """
         await self._ensure_session()
         
         try:
-            response = await self._make_request("POST", self.endpoints["info"], {
-                "type": "allMids"
-            })
+            response = await self._cached(
+                "allMids",
+                lambda: self._make_request("POST", self.endpoints["info"], {
+                    "type": "allMids"
+                }),
+                ALL_MIDS_CACHE_TTL
+            )
             
             return response
         
@@ -187,6 +323,8 @@ class HyperCoreClient:
     async def get_l2_book(self, coin: str) -> Dict[str, Any]:
         """Get L2 order book for an asset.
         
+        Results are cached per coin for ``L2_BOOK_CACHE_TTL`` seconds.
+        
         Args:
             coin: Asset symbol
             
@@ -196,33 +334,71 @@ class HyperCoreClient:
         await self._ensure_session()
         
         try:
-            response = await self._make_request("POST", self.endpoints["info"], {
-                "type": "l2Book",
-                "coin": coin
-            })
+            response = await self._cached(
+                f"l2Book:{coin}",
+                lambda: self._make_request("POST", self.endpoints["info"], {
+                    "type": "l2Book",
+                    "coin": coin
+                }),
+                L2_BOOK_CACHE_TTL
+            )
             
             return response
         
         except Exception as error:
             raise NetworkError(f"Failed to get L2 book: {error}")
     
+    async def _cached(
+        self,
+        key: str,
+        fetch: Callable[[], Awaitable[Any]],
+        ttl: float
+    ) -> Any:
+        """Return a cached response, fetching it at most once per TTL window.
+        
+        Args:
+            key: Cache key (request type plus payload)
+            fetch: Factory for the upstream request coroutine
+            ttl: Lifetime of a fetched value in seconds
+            
+        Returns:
+            Any: Cached or freshly fetched value
+        """
+        entry = self._cache.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+        
+        lock = self._cache_locks.get(key)
+        if lock is None:
+            lock = self._cache_locks[key] = asyncio.Lock()
+        
+        async with lock:
+            # Another task may have refreshed the entry while we waited
+            entry = self._cache.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                return entry[1]
+            
+            value = await fetch()
+            self._cache[key] = (time.monotonic() + ttl, value)
+            return value
+    
     async def _get_user_positions(self, user_address: str) -> Optional[List[Position]]:
         """Get user positions from HyperCore."""
         try:
             user_info = await self.get_user_info(user_address)
             
-            positions = []
-            if "assetPositions" in user_info:
-                for pos_data in user_info["assetPositions"]:
-                    if pos_data["position"]["szi"] != "0":
-                        position = Position(
-                            asset=str(pos_data["position"].get("coin", "unknown")),
-                            size=pos_data["position"]["szi"],
-                            entry_price=pos_data["position"].get("entryPx", "0"),
-                            unrealized_pnl=pos_data["position"].get("unrealizedPnl", "0"),
-                            side="LONG" if float(pos_data["position"]["szi"]) > 0 else "SHORT"
-                        )
-                        positions.append(position)
+            # Sizes are signed decimal strings; the sign gives the side
+            positions = [
+                Position(
+                    asset=str(pos.get("coin", "unknown")),
+                    size=szi,
+                    entry_price=pos.get("entryPx", "0"),
+                    unrealized_pnl=pos.get("unrealizedPnl", "0"),
+                    side="SHORT" if szi[:1] == "-" else "LONG"
+                )
+                for pos in (pos_data["position"] for pos_data in user_info.get("assetPositions", ()))
+                if (szi := pos["szi"]) != "0"
+            ]
             
             return positions if positions else None
         
@@ -232,34 +408,36 @@ class HyperCoreClient:
     async def _get_market_data(self) -> Optional[MarketData]:
         """Get market data from HyperCore."""
         try:
-            # Get mid prices
-            mids = await self.get_all_mids()
-            
-            # Get market meta info for depth data
-            market_info = await self.get_market_info()
+            # Get mid prices and market meta info (for depth data) together
+            mids, market_info = await asyncio.gather(
+                self.get_all_mids(),
+                self.get_market_info()
+            )
             
             depths = {}
             if "universe" in market_info:
-                for asset_info in market_info["universe"]:
-                    asset_name = asset_info["name"]
-                    
-                    # Get L2 book for depth info
-                    try:
-                        l2_book = await self.get_l2_book(asset_name)
-                        
-                        if "levels" in l2_book and len(l2_book["levels"]) >= 2:
-                            bids = l2_book["levels"][0]
-                            asks = l2_book["levels"][1]
-                            
-                            if bids and asks:
-                                depths[asset_name] = MarketDepth(
-                                    bid=bids[0]["px"] if bids[0] else "0",
-                                    ask=asks[0]["px"] if asks[0] else "0",
-                                    bid_size=bids[0]["sz"] if bids[0] else "0",
-                                    ask_size=asks[0]["sz"] if asks[0] else "0"
-                                )
-                    except Exception:
-                        continue
+                # Fetch every asset's L2 book concurrently, bounded by the
+                # semaphore, and fold each in as soon as it arrives
+                async def named_depth(asset_name: str) -> Tuple[str, Optional[MarketDepth]]:
+                    return asset_name, await self._get_market_depth(asset_name)
+                
+                tasks = [
+                    asyncio.create_task(named_depth(asset_info["name"]))
+                    for asset_info in market_info["universe"]
+                ]
+                try:
+                    for next_depth in asyncio.as_completed(tasks, timeout=self.market_data_budget):
+                        asset_name, depth = await next_depth
+                        if depth is not None:
+                            depths[asset_name] = depth
+                except asyncio.TimeoutError:
+                    # Out of budget: return the partial depths gathered so far
+                    if self.debug:
+                        print(f"[HyperCore Client] Market data budget exceeded, "
+                              f"{len(depths)}/{len(tasks)} depths collected")
+                finally:
+                    for task in tasks:
+                        task.cancel()
             
             return MarketData(
                 prices=mids,
@@ -270,23 +448,56 @@ class HyperCoreClient:
         except Exception:
             return None
     
+    async def _get_market_depth(self, asset_name: str) -> Optional[MarketDepth]:
+        """Get top-of-book depth for an asset, or None if unavailable."""
+        try:
+            async with self._request_semaphore:
+                l2_book = await self.get_l2_book(asset_name)
+            
+            if "levels" in l2_book and len(l2_book["levels"]) >= 2:
+                bids = l2_book["levels"][0]
+                asks = l2_book["levels"][1]
+                
+                if bids and asks:
+                    return MarketDepth(
+                        bid=bids[0]["px"] if bids[0] else "0",
+                        ask=asks[0]["px"] if asks[0] else "0",
+                        bid_size=bids[0]["sz"] if bids[0] else "0",
+                        ask_size=asks[0]["sz"] if asks[0] else "0"
+                    )
+        except Exception:
+            pass
+        
+        return None
+    
     async def _get_core_state(self) -> Dict[str, Any]:
         """Get HyperCore state information."""
         try:
             market_info = await self.get_market_info()
             return {
                 "market_info": market_info,
-                "timestamp": asyncio.get_event_loop().time()
+                "timestamp": time.monotonic()
             }
         except Exception:
-            return {"timestamp": asyncio.get_event_loop().time()}
+            return {"timestamp": time.monotonic()}
     
     def _analyze_cross_layer_interactions(self, transaction: TransactionRequest) -> List[CoreInteraction]:
         """Analyze potential cross-layer interactions."""
+        # Addresses may arrive checksummed; compare case-insensitively
+        targets_precompile = (transaction.to or "").lower() in _PRECOMPILE_VALUES
+        scan_calldata = (
+            transaction.data is not None
+            and len(transaction.data) >= _MIN_ADDRESS_CALLDATA_LEN
+        )
+        
+        # Plain transfers and short calls cannot involve HyperCore
+        if not targets_precompile and not scan_calldata:
+            return []
+        
         interactions = []
         
         # Check if transaction interacts with precompiles
-        if transaction.to in PRECOMPILE_ADDRESSES.values():
+        if targets_precompile:
             interaction_type = "read" if transaction.data == "0x" else "write"
             
             interactions.append(CoreInteraction(
@@ -297,10 +508,11 @@ class HyperCoreClient:
             ))
         
         # Check if transaction data contains precompile interactions
-        if transaction.data and len(transaction.data) > 10:
-            # Look for precompile addresses in calldata
-            for name, address in PRECOMPILE_ADDRESSES.items():
-                if address.lower().replace("0x", "") in transaction.data.lower():
+        if scan_calldata:
+            # Look for precompile addresses in calldata with one scan
+            found = {match.group(1) for match in _PRECOMPILE_RE.finditer(transaction.data.lower())}
+            for hex_address, address in _PRECOMPILE_BY_HEX.items():
+                if hex_address in found:
                     interactions.append(CoreInteraction(
                         interaction_type="read",
                         precompile=address,
@@ -334,12 +546,18 @@ class HyperCoreClient:
         
         try:
             if method.upper() == "POST":
-                async with self._session.post(url, json=data) as response:
+                # Pre-encoded body: set the JSON content type explicitly in
+                # case a shared session was created without it
+                async with self._session.post(
+                    url,
+                    data=json_dumps_bytes(data),
+                    headers=_JSON_HEADERS
+                ) as response:
                     if response.status != 200:
                         error_text = await response.text()
                         raise NetworkError(f"HTTP {response.status}: {error_text}")
                     
-                    result = await response.json()
+                    result = json_loads(await response.read())
                     return result
             
             else:
@@ -348,18 +566,18 @@ class HyperCoreClient:
                         error_text = await response.text()
                         raise NetworkError(f"HTTP {response.status}: {error_text}")
                     
-                    result = await response.json()
+                    result = json_loads(await response.read())
                     return result
         
         except aiohttp.ClientError as e:
             raise NetworkError(f"Request failed: {e}")
-        except json.JSONDecodeError as e:
+        except JSONDecodeError as e:
             raise NetworkError(f"Invalid JSON response: {e}")
     
     def is_enabled(self) -> bool:
         """Check if cross-layer integration is enabled."""
         return self.enabled
     
-    def get_endpoints(self) -> Dict[str, str]:
-        """Get API endpoints."""
-        return self.endpoints.copy()
+    def get_endpoints(self) -> Mapping[str, str]:
+        """Get API endpoints as a read-only view."""
+        return MappingProxyType(self.endpoints)
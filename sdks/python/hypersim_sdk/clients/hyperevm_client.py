@@ -3,6 +3,7 @@ HyperEVM client for blockchain interactions with AsyncIO.
 """
 
 import asyncio
+import re
 from typing import Optional, Dict, Any, Union
 import aiohttp
 from web3 import AsyncWeb3
@@ -14,17 +15,33 @@ from ..types.errors import NetworkError, SimulationError, TimeoutError, Validati
 from ..utils.validators import validate_transaction_request, validate_network
 from ..utils.formatters import format_wei_to_ether
 from ..utils.constants import GAS_CONSTANTS, TRANSACTION_CONSTANTS
+from ..utils.caching import ttl_cached
+
+
+# Chain-state reads change at most once per block; cache them briefly so
+# bursts of polling collapse into one RPC
+CHAIN_STATE_CACHE_TTL = 0.5
+BLOCK_TIME_CACHE_TTL = 10.0
+
+# Captures the reason following "revert"/"reverted" up to the end of the line
+_REVERT_RE = re.compile(r"revert(?:ed)?[:\s]+(.+?)(?:$|\n)", re.IGNORECASE)
 
 
 class HyperEVMClient:
     """Async client for interacting with HyperEVM network."""
     
+    __slots__ = (
+        "network", "config", "timeout", "debug", "w3",
+        "_session", "_owns_session", "_provider_session_cached", "_ttl_cache"
+    )
+    
     def __init__(
         self,
         network: Network,
         rpc_endpoint: Optional[str] = None,
         timeout: float = 30.0,
-        debug: bool = False
+        debug: bool = False,
+        session: Optional[aiohttp.ClientSession] = None
     ) -> None:
         """Initialize HyperEVM client.
         
@@ -33,6 +50,8 @@ class HyperEVMClient:
             rpc_endpoint: Custom RPC endpoint (optional)
             timeout: Request timeout in seconds
             debug: Enable debug logging
+            session: Shared session to use for RPC traffic; the caller keeps
+                ownership
         """
         self.network = validate_network(network)
         self.config = get_network_config(self.network)
@@ -53,8 +72,13 @@ class HyperEVMClient:
         # Add PoA middleware if needed
         self.w3.middleware_onion.inject(async_geth_poa_middleware, layer=0)
         
-        # HTTP session for direct RPC calls
-        self._session: Optional[aiohttp.ClientSession] = None
+        # HTTP session for direct RPC calls; only closed here if we created it
+        self._session: Optional[aiohttp.ClientSession] = session
+        self._owns_session = session is None
+        self._provider_session_cached = False
+        
+        # Backing store for @ttl_cached methods
+        self._ttl_cache: Dict[Any, Any] = {}
         
         if self.debug:
             print(f"[HyperEVM Client] Initialized for {self.network} at {rpc_url}")
@@ -68,15 +92,39 @@ class HyperEVMClient:
         """Async context manager exit."""
         await self.close()
     
+    async def use_session(self, session: aiohttp.ClientSession) -> None:
+        """Switch to a shared session owned by the caller.
+        
+        The session is registered with the Web3 provider right away, so RPC
+        calls made without entering the context manager still use it.
+        
+        Args:
+            session: Session to use; ``close()`` will leave it open
+        """
+        self._session = session
+        self._owns_session = False
+        self._provider_session_cached = False
+        await self._ensure_session()
+    
     async def _ensure_session(self) -> None:
-        """Ensure HTTP session is created."""
+        """Ensure HTTP session is created.
+        
+        A shared session is also handed to the Web3 provider so RPC calls go
+        over its pooled connections rather than a second session.
+        """
+        if not self._owns_session:
+            if not self._provider_session_cached:
+                await self.w3.provider.cache_async_session(self._session)
+                self._provider_session_cached = True
+            return
+        
         if self._session is None or self._session.closed:
             timeout = aiohttp.ClientTimeout(total=self.timeout)
             self._session = aiohttp.ClientSession(timeout=timeout)
     
     async def close(self) -> None:
         """Close the client and cleanup resources."""
-        if self._session and not self._session.closed:
+        if self._owns_session and self._session and not self._session.closed:
             await self._session.close()
         
         if self.debug:
@@ -105,14 +153,21 @@ class HyperEVMClient:
             # Format transaction for Web3
             tx_params = self._format_transaction(transaction)
             
-            # Simulate using eth_call
-            call_result = await self.w3.eth.call(tx_params)
+            # eth_call, gas estimation and the latest block are independent
+            # reads against the same node, so issue them concurrently
+            call_result, gas_estimate, current_block = await asyncio.gather(
+                self.w3.eth.call(tx_params),
+                self.w3.eth.estimate_gas(tx_params),
+                self.w3.eth.get_block('latest'),
+                return_exceptions=True
+            )
             
-            # Estimate gas usage
-            gas_estimate = await self.w3.eth.estimate_gas(tx_params)
+            # Surface failures in the original call order so a revert from
+            # eth_call takes precedence over the gas estimation error
+            for outcome in (call_result, gas_estimate, current_block):
+                if isinstance(outcome, BaseException):
+                    raise outcome
             
-            # Get current block info
-            current_block = await self.w3.eth.get_block('latest')
             if current_block is None:
                 raise NetworkError("Unable to fetch current block")
             
@@ -164,6 +219,7 @@ class HyperEVMClient:
             
             raise SimulationError(f"HyperEVM simulation failed: {error_msg}")
     
+    @ttl_cached(CHAIN_STATE_CACHE_TTL)
     async def get_network_status(self) -> NetworkStatus:
         """Get network status and health information.
         
@@ -202,6 +258,8 @@ class HyperEVMClient:
     async def get_block_info(self, block_number: Optional[Union[int, str]] = None) -> BlockInfo:
         """Get block information.
         
+        The latest block is cached briefly; historical blocks are always fetched.
+        
         Args:
             block_number: Block number or 'latest'
             
@@ -211,11 +269,22 @@ class HyperEVMClient:
         Raises:
             NetworkError: If block not found or fetch fails
         """
+        if not block_number or block_number == 'latest':
+            return await self._get_latest_block_info()
+        return await self._fetch_block_info(block_number)
+    
+    @ttl_cached(CHAIN_STATE_CACHE_TTL)
+    async def _get_latest_block_info(self) -> BlockInfo:
+        """Get the latest block, shared between callers within the cache TTL."""
+        return await self._fetch_block_info('latest')
+    
+    async def _fetch_block_info(self, block_number: Union[int, str]) -> BlockInfo:
+        """Fetch a block from the node and convert it to BlockInfo."""
         try:
-            block = await self.w3.eth.get_block(block_number or 'latest', full_transactions=False)
+            block = await self.w3.eth.get_block(block_number, full_transactions=False)
             
             if block is None:
-                raise NetworkError(f"Block {block_number or 'latest'} not found")
+                raise NetworkError(f"Block {block_number} not found")
             
             block_type = self._determine_block_type_from_gas_limit(block.gasLimit)
             
@@ -270,6 +339,7 @@ class HyperEVMClient:
         except Exception as error:
             raise NetworkError(f"Failed to get nonce: {error}")
     
+    @ttl_cached(CHAIN_STATE_CACHE_TTL)
     async def get_gas_price(self) -> str:
         """Get current gas price.
         
@@ -329,25 +399,22 @@ class HyperEVMClient:
     
     def _extract_revert_reason(self, error_msg: str) -> Optional[str]:
         """Extract revert reason from error message."""
-        # Try to extract revert reason from common error formats
-        if "revert" in error_msg:
-            parts = error_msg.split("revert")
-            if len(parts) > 1:
-                reason = parts[1].strip()
-                return reason if reason else None
-        return None
+        match = _REVERT_RE.search(error_msg)
+        return match.group(1).strip() if match else None
     
+    @ttl_cached(BLOCK_TIME_CACHE_TTL)
     async def _get_average_block_time(self) -> float:
         """Get average block time over last 10 blocks."""
         try:
-            current_block = await self.w3.eth.get_block('latest')
-            if not current_block:
+            # Resolve the head number first so both blocks can be fetched together
+            latest_number = await self.w3.eth.block_number
+            current_block, past_block = await asyncio.gather(
+                self.w3.eth.get_block(latest_number),
+                self.w3.eth.get_block(max(latest_number - 10, 0))
+            )
+            if not current_block or not past_block:
                 return 1.0  # Default for small blocks
             
-            past_block = await self.w3.eth.get_block(current_block.number - 10)
-            if not past_block:
-                return 1.0
-            
             time_diff = current_block.timestamp - past_block.timestamp
             block_diff = current_block.number - past_block.number
             
@@ -0,0 +1,66 @@
+"""
+Shared aiohttp session factory for SDK clients.
+"""
+
+import importlib.util
+from typing import Optional
+
+import aiohttp
+
+
+# Response reader buffer; aiohttp's 64 KiB default makes large Info API
+# bodies (meta, l2Book) pause and resume the transport several times
+READ_BUFSIZE = 2 ** 18
+
+# Idle pooled connections are kept this long (aiohttp defaults to 15s)
+KEEPALIVE_TIMEOUT = 60.0
+
+# aiohttp only decodes brotli when a brotli package is installed, so only
+# advertise it then; gzip/deflate are always supported
+_HAS_BROTLI = any(
+    importlib.util.find_spec(module) is not None for module in ("brotli", "brotlicffi")
+)
+ACCEPT_ENCODING = "gzip, deflate, br" if _HAS_BROTLI else "gzip, deflate"
+
+# Default headers for JSON API sessions; large meta/l2Book bodies compress well
+JSON_SESSION_HEADERS = {
+    "Content-Type": "application/json",
+    "Accept-Encoding": ACCEPT_ENCODING
+}
+
+
+def create_shared_session(
+    timeout: float,
+    limit: int = 100,
+    limit_per_host: Optional[int] = None
+) -> aiohttp.ClientSession:
+    """Create an aiohttp session to be shared by several clients.
+    
+    One long-lived session per application lets the HyperEVM and HyperCore
+    clients reuse the same keep-alive connections instead of each paying
+    its own TCP/TLS handshakes. The caller owns the session and must close
+    it; clients given a session leave it open on ``close()``.
+    
+    Must be called while an event loop is running.
+    
+    Args:
+        timeout: Total request timeout in seconds
+        limit: Maximum connections in the pool
+        limit_per_host: Maximum connections per host; defaults to ``limit``
+            since each client talks to a single host
+        
+    Returns:
+        aiohttp.ClientSession: New shared session
+    """
+    return aiohttp.ClientSession(
+        timeout=aiohttp.ClientTimeout(total=timeout),
+        connector=aiohttp.TCPConnector(
+            limit=limit,
+            limit_per_host=limit_per_host or limit,
+            ttl_dns_cache=300,
+            keepalive_timeout=KEEPALIVE_TIMEOUT,
+            enable_cleanup_closed=True
+        ),
+        headers=JSON_SESSION_HEADERS,
+        read_bufsize=READ_BUFSIZE
+    )
@@ -3,24 +3,92 @@ WebSocket streaming client with async context managers and automatic reconnectio
 """
 
 import asyncio
-import json
 import logging
+import re
+import sys
 import time
-from typing import Any, Dict, Optional, Callable, Set, AsyncGenerator, List
+from typing import Any, Dict, Optional, Callable, Set, AsyncGenerator, List, NamedTuple, Tuple
 from contextlib import asynccontextmanager
-import websockets
 from websockets.exceptions import ConnectionClosed
 
+try:
+    # Sans-I/O based asyncio implementation (websockets >= 13)
+    from websockets.asyncio.client import connect as ws_connect
+    HAS_ASYNCIO_WEBSOCKETS = True
+except ImportError:  # pragma: no cover - legacy protocol on older releases
+    from websockets import connect as ws_connect
+    HAS_ASYNCIO_WEBSOCKETS = False
+
 from ..types.websocket import (
     WSConfig, WSMessage, WSSubscription, ConnectionState, WSMetrics,
     WSError, WSCloseInfo, SubscriptionType
 )
 from ..types.common import SubscriptionType as CommonSubscriptionType
 from ..types.errors import NetworkError, TimeoutError, ValidationError, WebSocketError
+from ..utils.serialization import JSONDecodeError, json_dumps, json_loads
 
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on the reconnect backoff delay in seconds
+MAX_RECONNECT_DELAY = 60.0
+
+# Received-message metrics are folded into WSMetrics every this many frames
+METRICS_FLUSH_INTERVAL = 128
+
+# Channel that raw binary frames are dispatched on when config.raw_binary is set
+BINARY_CHANNEL = 'binary'
+
+# First character of every JSON object/array frame; anything else (heartbeats,
+# protocol pings) is skipped without invoking the parser
+_JSON_TEXT_PREFIXES = ('{', '[')
+_JSON_BYTES_PREFIXES = (b'{', b'[')
+
+# Reads the channel of frames shaped {"channel": "...", ...} without a full
+# parse, so frames consumed only by raw handlers are never decoded
+_CHANNEL_PATTERN = r'\{\s*"channel"\s*:\s*"([^"\\]*)"'
+_CHANNEL_TEXT_RE = re.compile(_CHANNEL_PATTERN)
+_CHANNEL_BYTES_RE = re.compile(_CHANNEL_PATTERN.encode())
+
+# Optional subscription fields that distinguish subscriptions of one type
+_SUBSCRIPTION_KEY_FIELDS = ('coin', 'user', 'interval')
+
+
+class _SubscriptionMessages(NamedTuple):
+    """Subscribe/unsubscribe messages for one subscription, built once."""
+    
+    subscribe: Dict[str, Any]
+    unsubscribe: Dict[str, Any]
+    subscribe_frame: str
+    unsubscribe_frame: str
+    
+    @classmethod
+    def build(cls, subscription: CommonSubscriptionType) -> '_SubscriptionMessages':
+        """Serialize the subscription and both control frames."""
+        payload = subscription.dict()
+        subscribe = {'method': 'subscribe', 'subscription': payload}
+        unsubscribe = {'method': 'unsubscribe', 'subscription': payload}
+        return cls(subscribe, unsubscribe, json_dumps(subscribe), json_dumps(unsubscribe))
+
+
+def install_uvloop() -> bool:
+    """Install uvloop's event loop policy if uvloop is available.
+    
+    Only loops created afterwards use uvloop, so call this before
+    ``asyncio.run()``; a loop that is already running is unaffected.
+    
+    Returns:
+        bool: True if the uvloop policy was installed
+    """
+    try:
+        import uvloop
+    except ImportError:
+        logger.debug("uvloop not installed; using the default event loop")
+        return False
+    
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
 
 class WebSocketClient:
     """Asynchronous WebSocket client with reconnection and subscription management."""
@@ -38,6 +106,17 @@ class WebSocketClient:
         self.ws_url = ws_url
         self.config = config or WSConfig()
         
+        if self.config.use_uvloop:
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                install_uvloop()
+            else:
+                logger.warning(
+                    "use_uvloop has no effect once the event loop is running; "
+                    "call install_uvloop() before asyncio.run()"
+                )
+        
         # Event callbacks
         self.on_message = on_message
         self.on_connect = on_connect  
@@ -45,21 +124,41 @@ class WebSocketClient:
         self.on_error = on_error
         
         # Connection state
-        self._websocket: Optional[websockets.WebSocketServerProtocol] = None
+        self._websocket: Optional[Any] = None
         self._connection_state = ConnectionState.DISCONNECTED
         self._reconnect_count = 0
         self._running = False
+        self._connected_event = asyncio.Event()
+        
+        # Exponential backoff schedule, one delay per reconnect attempt
+        self._backoff = tuple(
+            min(self.config.reconnect_interval * (1 << attempt), MAX_RECONNECT_DELAY)
+            for attempt in range(self.config.max_reconnect_attempts)
+        )
         
         # Subscription management
         self._subscriptions: Dict[str, CommonSubscriptionType] = {}
-        self._message_handlers: Dict[str, List[Callable[[Any], None]]] = {}
+        self._subscription_messages: Dict[str, _SubscriptionMessages] = {}
+        # Handler tuples are replaced, never mutated, so dispatch can iterate
+        # them safely while subscribe/unsubscribe run between awaits
+        self._message_handlers: Dict[str, Tuple[Callable[[Any], None], ...]] = {}
+        # Same layout; these handlers receive the undecoded frame
+        self._raw_handlers: Dict[str, Tuple[Callable[[Any], None], ...]] = {}
         
         # Tasks
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
         self._connection_task: Optional[asyncio.Task] = None
+        self._writer_task: Optional[asyncio.Task] = None
+        
+        # Outbound queue drained by the writer task when batch_sends is on
+        self._out_queue: asyncio.Queue = asyncio.Queue(maxsize=self.config.message_queue_size)
         
         # Metrics
         self._metrics = WSMetrics()
-        self._start_time = time.time()
+        self._start_time = time.monotonic()
+        # Received frames not yet folded into _metrics; see _flush_receive_metrics
+        self._pending_messages = 0
+        self._pending_bytes = 0
         
     @property
     def state(self) -> ConnectionState:
@@ -68,18 +167,24 @@ class WebSocketClient:
         
     @property
     def is_connected(self) -> bool:
-        """Check if WebSocket is connected."""
-        return (
-            self._connection_state == ConnectionState.CONNECTED and
-            self._websocket is not None and
-            not self._websocket.closed
-        )
+        """Check if WebSocket is connected.
+        
+        The connection loop moves the state off CONNECTED whenever the socket
+        closes, so the state alone is authoritative.
+        """
+        return self._connection_state is ConnectionState.CONNECTED
         
     @property
     def metrics(self) -> WSMetrics:
-        """Get connection metrics."""
+        """Get connection metrics.
+        
+        Receive counters are batched in the message loop and folded in here,
+        so a quiet subscription never reports stale counts.
+        """
+        if self._pending_messages:
+            self._flush_receive_metrics()
         if self._connection_state == ConnectionState.CONNECTED:
-            self._metrics.connection_uptime = time.time() - self._start_time
+            self._metrics.connection_uptime = time.monotonic() - self._start_time
         return self._metrics
         
     async def connect(self) -> None:
@@ -89,19 +194,23 @@ class WebSocketClient:
             return
             
         self._running = True
-        self._connection_task = asyncio.create_task(self._connection_loop())
+        self._loop = asyncio.get_running_loop()
+        
+        # Eager tasks run synchronously until their first real suspension,
+        # skipping a scheduler round-trip for work that completes at once.
+        # Leave any task factory the application installed untouched.
+        if (self.config.eager_tasks and
+                hasattr(asyncio, "eager_task_factory") and
+                self._loop.get_task_factory() is None):
+            self._loop.set_task_factory(asyncio.eager_task_factory)
+        
+        self._connection_task = self._loop.create_task(self._connection_loop())
         
         # Wait for initial connection
         max_wait = self.config.connection_timeout
-        start_time = time.time()
-        
-        while (
-            self._connection_state != ConnectionState.CONNECTED and
-            time.time() - start_time < max_wait
-        ):
-            await asyncio.sleep(0.1)
-            
-        if self._connection_state != ConnectionState.CONNECTED:
+        try:
+            await asyncio.wait_for(self._connected_event.wait(), max_wait)
+        except asyncio.TimeoutError:
             raise TimeoutError(f"Failed to connect within {max_wait}s")
             
     async def disconnect(self) -> None:
@@ -109,17 +218,29 @@ class WebSocketClient:
         logger.info("Disconnecting WebSocket client")
         self._running = False
         
+        # Bounded waits: a stuck peer or handshake must not hang shutdown
+        timeout = self.config.shutdown_timeout
+        
         if self._connection_task:
-            self._connection_task.cancel()
+            task = self._connection_task
+            self._connection_task = None
+            task.cancel()
+            await asyncio.wait({task}, timeout=timeout)
+            if task.done() and not task.cancelled():
+                # Retrieve the outcome so a late failure is not reported as unhandled
+                task.exception()
+                
+        if self._websocket:
             try:
-                await self._connection_task
-            except asyncio.CancelledError:
+                await asyncio.wait_for(self._websocket.close(), timeout=timeout)
+            except asyncio.TimeoutError:
+                logger.warning(f"WebSocket close did not complete within {timeout}s")
+            except ConnectionClosed:
                 pass
                 
-        if self._websocket:
-            await self._websocket.close()
-            
+
         self._connection_state = ConnectionState.DISCONNECTED
+        self._connected_event.clear()
         self._websocket = None
         
     async def __aenter__(self) -> 'WebSocketClient':
@@ -136,18 +257,24 @@ class WebSocketClient:
         while self._running:
             try:
                 self._connection_state = ConnectionState.CONNECTING
+                self._connected_event.clear()
                 logger.info(f"Connecting to {self.ws_url}")
                 
                 self._websocket = await asyncio.wait_for(
-                    websockets.connect(
+                    ws_connect(
                         self.ws_url,
                         compression=None if not self.config.compression else "deflate",
                         max_size=self.config.max_message_size,
+                        # Bounded buffers: a slow consumer stops socket reads
+                        # instead of growing an in-memory backlog
+                        max_queue=self.config.inbound_queue_max,
+                        write_limit=self.config.write_limit,
                     ),
                     timeout=self.config.connection_timeout
                 )
                 
                 self._connection_state = ConnectionState.CONNECTED
+                self._connected_event.set()
                 self._reconnect_count = 0
                 
                 logger.info("WebSocket connected successfully")
@@ -158,11 +285,26 @@ class WebSocketClient:
                     except Exception as e:
                         logger.error(f"Error in connect callback: {e}")
                         
-                # Resubscribe to all subscriptions
-                await self._resubscribe_all()
+                if self.config.batch_sends:
+                    self._writer_task = self._loop.create_task(self._writer_loop())
                 
-                # Handle messages
-                await self._handle_messages()
+                try:
+                    # Resubscribe to all subscriptions
+                    await self._resubscribe_all()
+                    
+                    # Handle messages
+                    await self._handle_messages()
+                finally:
+                    self._stop_writer()
+                    
+                # The message stream ended because the socket closed
+                if self._connection_state is ConnectionState.CONNECTED:
+                    close_info = WSCloseInfo(
+                        code=self._websocket.close_code or 1000,
+                        reason=self._websocket.close_reason or "",
+                        was_clean=True
+                    )
+                    await self._handle_disconnect(close_info)
                 
             except asyncio.TimeoutError:
                 logger.error("WebSocket connection timeout")
@@ -180,10 +322,7 @@ class WebSocketClient:
             # Reconnection logic
             if self._running and self.config.auto_reconnect:
                 if self._reconnect_count < self.config.max_reconnect_attempts:
-                    delay = min(
-                        self.config.reconnect_interval * (2 ** self._reconnect_count),
-                        60.0
-                    )
+                    delay = self._backoff[self._reconnect_count]
                     logger.info(f"Reconnecting in {delay}s (attempt {self._reconnect_count + 1})")
                     
                     self._connection_state = ConnectionState.RECONNECTING
@@ -199,60 +338,156 @@ class WebSocketClient:
         if not self._websocket:
             return
             
+        raw_binary = self.config.raw_binary
+        message_handlers = self._message_handlers
+        raw_handler_map = self._raw_handlers
+        
         try:
+            # Receive counters are batched and flushed every
+            # METRICS_FLUSH_INTERVAL frames or when metrics are read
             async for message in self._websocket:
-                try:
-                    self._metrics.messages_received += 1
-                    self._metrics.bytes_received += len(message)
-                    self._metrics.last_activity = time.time()
+                self._metrics.last_activity = time.time()
+                self._pending_bytes += len(message)
+                self._pending_messages += 1
+                if self._pending_messages >= METRICS_FLUSH_INTERVAL:
+                    self._flush_receive_metrics()
                     
-                    # Parse message
-                    if isinstance(message, str):
-                        data = json.loads(message)
+                try:
+                    is_text = isinstance(message, str)
+                    if raw_binary and not is_text:
+                        # Pre-encoded payloads go to handlers untouched
+                        data = None
+                        channel = BINARY_CHANNEL
+                        payload = message
+                    elif message[:1] not in (_JSON_TEXT_PREFIXES if is_text else _JSON_BYTES_PREFIXES):
+                        logger.debug("Skipping non-JSON frame")
+                        continue
                     else:
-                        data = message
+                        channel = None
+                        if raw_handler_map:
+                            match = (_CHANNEL_TEXT_RE if is_text else _CHANNEL_BYTES_RE).match(message)
+                            if match:
+                                sniffed = match.group(1)
+                                channel = sys.intern(sniffed if is_text else sniffed.decode())
+                                raw_handlers = raw_handler_map.get(channel)
+                                if raw_handlers:
+                                    self._call_raw_handlers(raw_handlers, channel, message)
+                                    # Nobody needs the decoded form: skip parsing
+                                    if not self.on_message and channel not in message_handlers:
+                                        continue
+                                        
+                        # Parse text or binary frames directly; orjson takes both
+                        data = json_loads(message)
+                        payload = data.get('data', data)
                         
-                    # Create WSMessage
-                    ws_message = WSMessage(
-                        channel=data.get('channel', 'unknown'),
-                        data=data.get('data', data),
-                        message_type=data.get('type'),
-                        sequence=data.get('sequence')
-                    )
-                    
+                        if channel is None:
+                            # Interned so handler lookups hit the identity fast path
+                            channel = data.get('channel', 'unknown')
+                            if type(channel) is str:
+                                channel = sys.intern(channel)
+                            if raw_handler_map and channel in raw_handler_map:
+                                self._call_raw_handlers(raw_handler_map[channel], channel, message)
+                        
+                    # Only pay for pydantic validation when a callback wants it
                     if self.on_message:
                         try:
-                            self.on_message(ws_message)
+                            self.on_message(WSMessage(
+                                channel=channel,
+                                data=payload,
+                                message_type=data.get('type') if data else None,
+                                sequence=data.get('sequence') if data else None
+                            ))
                         except Exception as e:
                             logger.error(f"Error in message callback: {e}")
                             
-                    await self._dispatch_message(ws_message)
-                    
-                except json.JSONDecodeError as e:
+                    # Dispatch inline: one lookup, no intermediate message object
+                    handlers = message_handlers.get(channel)
+                    if handlers:
+                        for handler in handlers:
+                            try:
+                                handler(payload)
+                            except Exception as e:
+                                logger.error(f"Error in message handler for {channel}: {e}")
+                                
+
+                except JSONDecodeError as e:
                     logger.error(f"Failed to parse message: {e}")
                     self._metrics.errors += 1
                 except Exception as e:
                     logger.error(f"Error handling message: {e}")
                     self._metrics.errors += 1
                     
-        except ConnectionClosed:
-            logger.info("WebSocket message stream closed")
-        except Exception as e:
-            logger.error(f"Error in message handler: {e}")
-            raise
-            
-    async def _dispatch_message(self, message: WSMessage) -> None:
-        """Dispatch message to registered handlers."""
-        handlers = self._message_handlers.get(message.channel, [])
+        finally:
+            # A clean close ends the iteration; abnormal closes and other
+            # errors propagate to _connection_loop, which reports them
+            if self._pending_messages:
+                self._flush_receive_metrics()
+                
+    def _call_raw_handlers(
+        self,
+        handlers: Tuple[Callable[[Any], None], ...],
+        channel: str,
+        frame: Any
+    ) -> None:
+        """Pass an undecoded frame to raw handlers."""
         for handler in handlers:
             try:
-                handler(message.data)
+                handler(frame)
+            except Exception as e:
+                logger.error(f"Error in raw message handler for {channel}: {e}")
+                
+    def _flush_receive_metrics(self) -> None:
+        """Fold pending received-frame counts into the metrics.
+        
+        ``last_activity`` is stamped by the message loop on every frame, so
+        it is always current even while counts are pending.
+        """
+        self._metrics.messages_received += self._pending_messages
+        self._metrics.bytes_received += self._pending_bytes
+        self._pending_messages = self._pending_bytes = 0
+        
+    async def _writer_loop(self) -> None:
+        """Send queued messages, coalescing whatever is waiting into one frame."""
+        queue = self._out_queue
+        max_batch = self.config.send_batch_size
+        
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < max_batch:
+                try:
+                    batch.append(queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+                    
+            payload = json_dumps(batch)
+            try:
+                await self._websocket.send(payload)
+            except ConnectionClosed:
+                logger.error(f"WebSocket connection closed with {len(batch)} queued messages unsent")
+                self._metrics.errors += 1
+                return
             except Exception as e:
-                logger.error(f"Error in message handler for {message.channel}: {e}")
+                logger.error(f"Failed to send batched messages: {e}")
+                self._metrics.errors += 1
+                continue
                 
+            self._metrics.messages_sent += len(batch)
+            self._metrics.bytes_sent += len(payload)
+            
+    def _stop_writer(self) -> None:
+        """Cancel the writer task and drop messages queued for the old socket."""
+        if self._writer_task:
+            self._writer_task.cancel()
+            self._writer_task = None
+            
+        # Subscriptions are replayed on reconnect, so stale frames are discarded
+        while not self._out_queue.empty():
+            self._out_queue.get_nowait()
+            
     async def _handle_connection_error(self, error: Exception) -> None:
         """Handle connection error."""
         self._connection_state = ConnectionState.ERROR
+        self._connected_event.clear()
         self._metrics.errors += 1
         
         if self.on_error:
@@ -264,6 +499,7 @@ class WebSocketClient:
     async def _handle_disconnect(self, close_info: WSCloseInfo) -> None:
         """Handle WebSocket disconnect."""
         self._connection_state = ConnectionState.DISCONNECTED
+        self._connected_event.clear()
         
         if self.on_disconnect:
             try:
@@ -275,35 +511,47 @@ class WebSocketClient:
         """Resubscribe to all active subscriptions."""
         logger.info(f"Resubscribing to {len(self._subscriptions)} subscriptions")
         
-        for sub_key, subscription in self._subscriptions.items():
+        # Snapshot: callbacks may subscribe/unsubscribe while we await sends
+        for sub_key in list(self._subscriptions):
+            if sub_key not in self._subscriptions:
+                continue
             try:
-                await self._send_subscription(subscription, subscribe=True)
+                await self._send_subscription(sub_key, subscribe=True)
             except Exception as e:
                 logger.error(f"Failed to resubscribe to {sub_key}: {e}")
                 
-    async def _send_subscription(
-        self,
-        subscription: CommonSubscriptionType,
-        subscribe: bool = True
-    ) -> None:
-        """Send subscription/unsubscription message."""
+    async def _send_subscription(self, sub_key: str, subscribe: bool = True) -> None:
+        """Send the cached subscription/unsubscription message for a key."""
         if not self.is_connected:
             raise NetworkError("WebSocket not connected")
             
-        message = {
-            'method': 'subscribe' if subscribe else 'unsubscribe',
-            'subscription': subscription.dict()
-        }
+        messages = self._subscription_messages[sub_key]
         
-        await self.send_message(message)
+        if self._writer_task is not None:
+            # Batched mode coalesces messages, so hand over the dict
+            await self.send_message(messages.subscribe if subscribe else messages.unsubscribe)
+        else:
+            await self._send_frame(messages.subscribe_frame if subscribe else messages.unsubscribe_frame)
         
     async def send_message(self, message: Dict[str, Any]) -> None:
         """Send message to WebSocket."""
         if not self.is_connected or not self._websocket:
             raise NetworkError("WebSocket not connected")
             
+        if self._writer_task is not None:
+            # Waits only when the queue is full, giving senders backpressure
+            await self._out_queue.put(message)
+            return
+            
+        # Kept as a text frame; servers expect JSON over text frames
+        await self._send_frame(json_dumps(message))
+        
+    async def _send_frame(self, message_str: str) -> None:
+        """Send an already-serialized text frame."""
+        if not self._websocket:
+            raise NetworkError("WebSocket not connected")
+            
         try:
-            message_str = json.dumps(message)
             await self._websocket.send(message_str)
             
             self._metrics.messages_sent += 1
@@ -319,20 +567,35 @@ class WebSocketClient:
     async def subscribe(
         self,
         subscription: CommonSubscriptionType,
-        handler: Optional[Callable[[Any], None]] = None
+        handler: Optional[Callable[[Any], None]] = None,
+        raw: bool = False
     ) -> str:
-        """Subscribe to data stream."""
-        sub_key = self._generate_subscription_key(subscription)
+        """Subscribe to data stream.
         
-        self._subscriptions[sub_key] = subscription
+        Subscribing to an existing key is idempotent: nothing is re-sent and
+        the handler is only added if not already registered.
+        
+        Raw handlers receive each frame exactly as read from the socket (str
+        or bytes) instead of the decoded ``data`` payload. Frames whose only
+        consumers are raw handlers are forwarded without JSON decoding, which
+        suits subscribers that fan frames out to other processes.
+        """
+        sub_key = sys.intern(self._generate_subscription_key(subscription))
         
         if handler:
-            if sub_key not in self._message_handlers:
-                self._message_handlers[sub_key] = []
-            self._message_handlers[sub_key].append(handler)
+            handler_map = self._raw_handlers if raw else self._message_handlers
+            handlers = handler_map.get(sub_key, ())
+            if handler not in handlers:
+                handler_map[sub_key] = handlers + (handler,)
+                
+        if sub_key in self._subscriptions:
+            return sub_key
             
+        self._subscriptions[sub_key] = subscription
+        self._subscription_messages[sub_key] = _SubscriptionMessages.build(subscription)
+        
         if self.is_connected:
-            await self._send_subscription(subscription, subscribe=True)
+            await self._send_subscription(sub_key, subscribe=True)
             
         self._metrics.active_subscriptions += 1
         logger.info(f"Subscribed to {sub_key}")
@@ -345,14 +608,13 @@ class WebSocketClient:
             logger.warning(f"Subscription {subscription_key} not found")
             return
             
-        subscription = self._subscriptions[subscription_key]
-        
         if self.is_connected:
-            await self._send_subscription(subscription, subscribe=False)
+            await self._send_subscription(subscription_key, subscribe=False)
             
         del self._subscriptions[subscription_key]
-        if subscription_key in self._message_handlers:
-            del self._message_handlers[subscription_key]
+        del self._subscription_messages[subscription_key]
+        self._message_handlers.pop(subscription_key, None)
+        self._raw_handlers.pop(subscription_key, None)
             
         self._metrics.active_subscriptions = max(0, self._metrics.active_subscriptions - 1)
         logger.info(f"Unsubscribed from {subscription_key}")
@@ -361,11 +623,10 @@ class WebSocketClient:
         """Generate unique subscription key."""
         parts = [subscription.type]
         
-        if hasattr(subscription, 'coin') and subscription.coin:
-            parts.append(subscription.coin)
-        if hasattr(subscription, 'user') and subscription.user:
-            parts.append(subscription.user)
-        if hasattr(subscription, 'interval') and subscription.interval:
-            parts.append(subscription.interval)
-            
+        # Fields differ between subscription models, so absent ones read as None
+        for field_name in _SUBSCRIPTION_KEY_FIELDS:
+            value = getattr(subscription, field_name, None)
+            if value:
+                parts.append(value)
+                
         return ':'.join(parts)
@@ -3,8 +3,9 @@ Main HyperSim SDK class with AsyncIO patterns and comprehensive functionality.
 """
 
 import asyncio
+import itertools
 import uuid
-from typing import Optional, List, Dict, Any, Callable, Union
+from typing import Optional, List, Dict, Any, Callable, Set, Union
 from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
 
@@ -23,6 +24,7 @@ from ..types.errors import (
 from ..clients.hyperevm_client import HyperEVMClient
 from ..clients.hypercore_client import HyperCoreClient
 from ..clients.websocket_client import WebSocketClient
+from ..clients.session import create_shared_session
 from ..ai.ai_analyzer import AIAnalyzer
 from ..plugins.plugin_system import PluginSystem, HookType, HookContext, PluginConfig
 from ..utils.validators import (
@@ -108,9 +110,13 @@ class HyperSimSDK:
         
         self.config = config
         self.network_config = get_network_config(config.network)
-        self._request_counter = 0
+        self._request_counter = itertools.count(1)
         self._initialized = False
         
+        # Connection pool shared by both clients; created in initialize()
+        # because aiohttp sessions must be built inside a running loop
+        self._http_session = None
+        
         # Initialize clients
         self._hyperevm_client = HyperEVMClient(
             network=config.network,
@@ -155,9 +161,14 @@ class HyperSimSDK:
             self._security_manager = SecurityManager(security_config)
         
         # Event callbacks
-        self._message_callbacks: List[Callable[[WSMessage], Any]] = []
-        self._connection_callbacks: List[Callable[[ConnectionState], Any]] = []
-        self._error_callbacks: List[Callable[[Exception], Any]] = []
+        # Sync and async callbacks are split at registration so notifying never inspects them
+        self._message_callbacks_sync: List[Callable[[WSMessage], Any]] = []
+        self._message_callbacks_async: List[Callable[[WSMessage], Any]] = []
+        self._callback_tasks: Set[asyncio.Task] = set()
+        self._connection_callbacks_sync: List[Callable[[ConnectionState], Any]] = []
+        self._connection_callbacks_async: List[Callable[[ConnectionState], Any]] = []
+        self._error_callbacks_sync: List[Callable[[Exception], Any]] = []
+        self._error_callbacks_async: List[Callable[[Exception], Any]] = []
         
         if config.debug:
             print(f"[HyperSim SDK] Initialized v{SDK_VERSION} for {config.network}")
@@ -184,15 +195,25 @@ class HyperSimSDK:
             return
         
         try:
-            # Initialize plugin system
-            await self._initialize_plugins()
+            # Share one connection pool between the EVM and Core clients
+            if self._http_session is None or self._http_session.closed:
+                # Size the pool for HyperCore, whose market-data fan-out is the widest
+                self._http_session = create_shared_session(
+                    self.config.timeout,
+                    limit=self._hypercore_client.connection_limit,
+                    limit_per_host=self._hypercore_client.per_host_limit
+                )
+                await self._hyperevm_client.use_session(self._http_session)
+                self._hypercore_client.use_session(self._http_session)
             
-            # Initialize plugin system
-            await self._plugin_system.initialize()
+            # Register configured plugins before the plugin system starts
+            await self._initialize_plugins()
             
-            # Initialize security manager
+            # Plugin system and security manager are independent; start both at once
+            startup = [self._plugin_system.initialize()]
             if self._security_manager:
-                await self._security_manager.initialize()
+                startup.append(self._security_manager.initialize())
+            await asyncio.gather(*startup)
             
             self._initialized = True
             
@@ -208,24 +229,28 @@ class HyperSimSDK:
             return
         
         try:
-            # Disconnect WebSocket
+            # Components shut down independently, so close them concurrently
+            closers = [
+                self._plugin_system.shutdown(),
+                self._hyperevm_client.close(),
+                self._hypercore_client.close()
+            ]
             if self._websocket_client:
-                await self._websocket_client.disconnect()
-            
-            # Close AI analyzer
+                closers.append(self._websocket_client.disconnect())
             if self._ai_analyzer:
-                await self._ai_analyzer.close()
-            
-            # Shutdown plugin system
-            await self._plugin_system.shutdown()
-            
-            # Shutdown security manager
+                closers.append(self._ai_analyzer.close())
             if self._security_manager:
-                await self._security_manager.shutdown()
+                closers.append(self._security_manager.shutdown())
+            
+            results = await asyncio.gather(*closers, return_exceptions=True)
+            if self.config.debug:
+                for result in results:
+                    if isinstance(result, Exception):
+                        print(f"[HyperSim SDK] Shutdown error: {result}")
             
-            # Close clients
-            await self._hyperevm_client.close()
-            await self._hypercore_client.close()
+            # The shared pool outlives the clients that borrow it
+            if self._http_session and not self._http_session.closed:
+                await self._http_session.close()
             
             self._initialized = False
             
@@ -252,51 +277,50 @@ class HyperSimSDK:
         if not self._initialized:
             await self.initialize()
         
+        loop = asyncio.get_running_loop()
         request_id = self._generate_request_id()
+        # Built on the first hook phase with subscribers, then reused
+        context: Optional[HookContext] = None
         
         try:
             validate_transaction_request(transaction)
             
             # Execute before-simulation hooks
-            context = HookContext(
-                request_id=request_id,
-                timestamp=asyncio.get_event_loop().time(),
-                data=transaction
+            context = await self._execute_hooks(
+                HookType.BEFORE_SIMULATION, context, request_id, transaction, loop
             )
             
-            context = await self._plugin_system.execute_hooks(
-                HookType.BEFORE_SIMULATION, context, transaction
-            )
-            
-            if context.should_halt():
+            if context is not None and context.should_halt():
                 # Return cached result if available
-                if hasattr(context, 'cached_result'):
-                    return context.cached_result
+                cached_result = context.metadata.get("cached_result")
+                if cached_result is not None:
+                    return cached_result
             
             if self.config.debug:
                 print(f"[HyperSim SDK] Starting simulation {request_id}")
             
-            # Perform simulation
-            simulation_result = await self._hyperevm_client.simulate(transaction)
+            # Start HyperCore requests now so they overlap the EVM simulation
+            cross_layer = (self.config.cross_layer_enabled and 
+                           self._hypercore_client.is_enabled())
+            if cross_layer:
+                self._hypercore_client.prefetch(transaction)
             
-            # Fetch cross-layer data if enabled
-            if (self.config.cross_layer_enabled and 
-                simulation_result.success and 
-                self._hypercore_client.is_enabled()):
+            try:
+                # Perform simulation
+                simulation_result = await self._hyperevm_client.simulate(transaction)
                 
-                hypercore_data = await self._hypercore_client.get_relevant_data(transaction)
-                if hypercore_data:
-                    simulation_result.hypercore_data = hypercore_data
+                # Attach cross-layer data if the simulation succeeded
+                if cross_layer and simulation_result.success:
+                    hypercore_data = await self._hypercore_client.get_relevant_data(transaction)
+                    if hypercore_data:
+                        simulation_result.hypercore_data = hypercore_data
+            finally:
+                if cross_layer:
+                    self._hypercore_client.cancel_prefetch(transaction)
             
             # Execute after-simulation hooks
-            context = HookContext(
-                request_id=request_id,
-                timestamp=asyncio.get_event_loop().time(),
-                data=simulation_result
-            )
-            
-            await self._plugin_system.execute_hooks(
-                HookType.AFTER_SIMULATION, context, simulation_result
+            await self._execute_hooks(
+                HookType.AFTER_SIMULATION, context, request_id, simulation_result, loop
             )
             
             if self.config.debug:
@@ -306,15 +330,7 @@ class HyperSimSDK:
         
         except Exception as error:
             # Execute error hooks
-            error_context = HookContext(
-                request_id=request_id,
-                timestamp=asyncio.get_event_loop().time(),
-                data=error
-            )
-            
-            await self._plugin_system.execute_hooks(
-                HookType.ON_ERROR, error_context, error
-            )
+            await self._execute_hooks(HookType.ON_ERROR, context, request_id, error, loop)
             
             # Notify error callbacks
             await self._notify_error_callbacks(error)
@@ -342,55 +358,46 @@ class HyperSimSDK:
                 "AI features not enabled. Initialize with ai_enabled=True and provide openai_api_key"
             )
         
+        loop = asyncio.get_running_loop()
         request_id = self._generate_request_id()
+        # Built on the first hook phase with subscribers, then reused
+        context: Optional[HookContext] = None
         
         try:
             # Execute before-ai-analysis hooks
-            context = HookContext(
-                request_id=request_id,
-                timestamp=asyncio.get_event_loop().time(),
-                data=simulation_result
-            )
-            
-            await self._plugin_system.execute_hooks(
-                HookType.BEFORE_AI_ANALYSIS, context, simulation_result
+            context = await self._execute_hooks(
+                HookType.BEFORE_AI_ANALYSIS, context, request_id, simulation_result, loop
             )
             
             # Perform AI analysis
             insights = await self._ai_analyzer.analyze_simulation(simulation_result)
             
             # Execute after-ai-analysis hooks
-            context = HookContext(
-                request_id=request_id,
-                timestamp=asyncio.get_event_loop().time(),
-                data=insights
-            )
-            
-            await self._plugin_system.execute_hooks(
-                HookType.AFTER_AI_ANALYSIS, context, insights
+            await self._execute_hooks(
+                HookType.AFTER_AI_ANALYSIS, context, request_id, insights, loop
             )
             
             return insights
         
         except Exception as error:
             # Execute error hooks
-            error_context = HookContext(
-                request_id=request_id,
-                timestamp=asyncio.get_event_loop().time(),
-                data=error
-            )
-            
-            await self._plugin_system.execute_hooks(
-                HookType.ON_ERROR, error_context, error
-            )
+            await self._execute_hooks(HookType.ON_ERROR, context, request_id, error, loop)
             
             raise AIAnalysisError(f"AI analysis failed: {error}")
     
-    async def optimize_bundle(self, transactions: List[TransactionRequest]) -> BundleOptimization:
+    async def optimize_bundle(
+        self,
+        transactions: List[TransactionRequest],
+        max_concurrency: Optional[int] = None
+    ) -> BundleOptimization:
         """Optimize a bundle of transactions.
         
+        Transactions are simulated concurrently; results keep the input order
+        so reordering suggestions index the original bundle.
+        
         Args:
             transactions: List of transactions to optimize
+            max_concurrency: Maximum simulations in flight at once (unbounded if None)
             
         Returns:
             BundleOptimization: Optimization suggestions including gas savings
@@ -402,12 +409,28 @@ class HyperSimSDK:
         if not transactions:
             raise ValidationError("Transaction bundle cannot be empty")
         
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValidationError("max_concurrency must be at least 1")
+        
         try:
-            # Simulate each transaction
-            simulations = []
-            for transaction in transactions:
-                result = await self.simulate(transaction)
-                simulations.append(result)
+            # Simulate all transactions concurrently
+            if max_concurrency is None:
+                pending = [self.simulate(transaction) for transaction in transactions]
+            else:
+                semaphore = asyncio.Semaphore(max_concurrency)
+                
+                async def bounded_simulate(transaction: TransactionRequest) -> SimulationResult:
+                    async with semaphore:
+                        return await self.simulate(transaction)
+                
+                pending = [bounded_simulate(transaction) for transaction in transactions]
+            
+            # Let every simulation settle, then surface the first failure in bundle order
+            results = await asyncio.gather(*pending, return_exceptions=True)
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
+            simulations: List[SimulationResult] = results
             
             # Optimize bundle with AI if available
             if self._ai_analyzer:
@@ -513,9 +536,14 @@ class HyperSimSDK:
         Args:
             callback: Message handler function
         """
-        self._message_callbacks.append(callback)
-        if self._websocket_client:
-            self._websocket_client.on_message(callback)
+        if asyncio.iscoroutinefunction(callback):
+            self._message_callbacks_async.append(callback)
+        else:
+            self._message_callbacks_sync.append(callback)
+        
+        # The client only builds WSMessage objects once a dispatcher is installed
+        if self._websocket_client and self._websocket_client.on_message is None:
+            self._websocket_client.on_message = self._dispatch_message
     
     def on_connection_state_change(self, callback: Callable[[ConnectionState], Any]) -> None:
         """Register connection state change callback.
@@ -523,7 +551,10 @@ class HyperSimSDK:
         Args:
             callback: State change handler function
         """
-        self._connection_callbacks.append(callback)
+        if asyncio.iscoroutinefunction(callback):
+            self._connection_callbacks_async.append(callback)
+        else:
+            self._connection_callbacks_sync.append(callback)
     
     def on_error(self, callback: Callable[[Exception], Any]) -> None:
         """Register error callback.
@@ -531,7 +562,10 @@ class HyperSimSDK:
         Args:
             callback: Error handler function
         """
-        self._error_callbacks.append(callback)
+        if asyncio.iscoroutinefunction(callback):
+            self._error_callbacks_async.append(callback)
+        else:
+            self._error_callbacks_sync.append(callback)
     
     # Plugin system methods
     
@@ -599,8 +633,40 @@ class HyperSimSDK:
     
     def _generate_request_id(self) -> str:
         """Generate unique request ID."""
-        self._request_counter += 1
-        return f"req_{int(asyncio.get_event_loop().time())}_{self._request_counter}"
+        return f"req_{next(self._request_counter):x}"
+    
+    async def _execute_hooks(
+        self,
+        hook_type: HookType,
+        context: Optional[HookContext],
+        request_id: str,
+        data: Any,
+        loop: asyncio.AbstractEventLoop
+    ) -> Optional[HookContext]:
+        """Run one hook phase of a request.
+        
+        The context is only built, or advanced to this phase, when a plugin
+        handles the hook type; otherwise the call returns without awaiting.
+        
+        Args:
+            hook_type: Hook phase to run
+            context: Context from an earlier phase of the request, if any
+            request_id: Request the hooks belong to
+            data: Phase data passed to the hooks
+            loop: Running event loop, used for the context timestamp
+            
+        Returns:
+            The context after hook execution, or the input context if skipped
+        """
+        if not self._plugin_system.has_hook(hook_type):
+            return context
+        
+        if context is None:
+            context = HookContext(request_id, loop.time(), data)
+        else:
+            context.advance(data, loop.time())
+        
+        return await self._plugin_system.execute_hooks(hook_type, context, data)
     
     async def _initialize_plugins(self) -> None:
         """Initialize configured plugins."""
@@ -618,19 +684,14 @@ class HyperSimSDK:
         
         async def on_state_change(state: ConnectionState) -> None:
             await self._notify_connection_callbacks(state)
+            loop = asyncio.get_running_loop()
             
-            if state == ConnectionState.CONNECTED:
-                context = HookContext(
-                    request_id="ws_connect",
-                    timestamp=asyncio.get_event_loop().time()
-                )
+            if state == ConnectionState.CONNECTED and self._plugin_system.has_hook(HookType.ON_CONNECT):
+                context = HookContext("ws_connect", loop.time())
                 await self._plugin_system.execute_hooks(HookType.ON_CONNECT, context)
             
-            elif state == ConnectionState.DISCONNECTED:
-                context = HookContext(
-                    request_id="ws_disconnect",
-                    timestamp=asyncio.get_event_loop().time()
-                )
+            elif state == ConnectionState.DISCONNECTED and self._plugin_system.has_hook(HookType.ON_DISCONNECT):
+                context = HookContext("ws_disconnect", loop.time())
                 await self._plugin_system.execute_hooks(HookType.ON_DISCONNECT, context)
         
         async def on_ws_error(error) -> None:
@@ -672,29 +733,77 @@ class HyperSimSDK:
             "recommendations": ["Enable AI features for detailed risk analysis"]
         }
     
+    def _dispatch_message(self, message: WSMessage) -> None:
+        """Fan a WebSocket message out to registered message callbacks.
+        
+        Called synchronously from the receive loop, so async callbacks are
+        scheduled as tasks rather than awaited.
+        """
+        for callback in self._message_callbacks_sync:
+            try:
+                callback(message)
+            except Exception as error:
+                if self.config.debug:
+                    print(f"[HyperSim SDK] Message callback error: {error}")
+        
+        for callback in self._message_callbacks_async:
+            task = asyncio.ensure_future(callback(message))
+            self._callback_tasks.add(task)
+            task.add_done_callback(self._on_callback_task_done)
+    
+    def _on_callback_task_done(self, task: asyncio.Task) -> None:
+        """Release a finished async message callback and report its error."""
+        self._callback_tasks.discard(task)
+        if task.cancelled():
+            return
+        error = task.exception()
+        if error is not None and self.config.debug:
+            print(f"[HyperSim SDK] Message callback error: {error}")
+    
     async def _notify_connection_callbacks(self, state: ConnectionState) -> None:
-        """Notify connection state change callbacks."""
-        for callback in self._connection_callbacks:
+        """Notify connection state change callbacks.
+        
+        Sync callbacks run inline; async callbacks run concurrently so one
+        slow observer does not delay the rest.
+        """
+        for callback in self._connection_callbacks_sync:
             try:
-                if asyncio.iscoroutinefunction(callback):
-                    await callback(state)
-                else:
-                    callback(state)
+                callback(state)
             except Exception as error:
                 if self.config.debug:
                     print(f"[HyperSim SDK] Connection callback error: {error}")
+        
+        if self._connection_callbacks_async:
+            results = await asyncio.gather(
+                *(callback(state) for callback in self._connection_callbacks_async),
+                return_exceptions=True
+            )
+            if self.config.debug:
+                for result in results:
+                    if isinstance(result, Exception):
+                        print(f"[HyperSim SDK] Connection callback error: {result}")
     
     async def _notify_error_callbacks(self, error: Exception) -> None:
-        """Notify error callbacks."""
-        for callback in self._error_callbacks:
+        """Notify error callbacks.
+        
+        Sync callbacks run inline; async callbacks run concurrently.
+        """
+        for callback in self._error_callbacks_sync:
             try:
-                if asyncio.iscoroutinefunction(callback):
-                    await callback(error)
-                else:
-                    callback(error)
+                callback(error)
             except Exception as cb_error:
                 if self.config.debug:
                     print(f"[HyperSim SDK] Error callback error: {cb_error}")
+        
+        if self._error_callbacks_async:
+            results = await asyncio.gather(
+                *(callback(error) for callback in self._error_callbacks_async),
+                return_exceptions=True
+            )
+            if self.config.debug:
+                for result in results:
+                    if isinstance(result, Exception):
+                        print(f"[HyperSim SDK] Error callback error: {result}")
     
     # Properties
     
@@ -4,8 +4,8 @@ Custom exception classes for the HyperSim SDK.
 
 from .types.errors import (
     HyperSimError, ValidationError, NetworkError, SimulationError, 
-    AIAnalysisError, TimeoutError, RateLimitError, WebSocketError, 
-    PluginError, ConfigurationError
+    AIAnalysisError, TimeoutError, RateLimitError, APIError, AuthenticationError,
+    WebSocketError, PluginError, ConfigurationError
 )
 
 # Re-export all error types for easy access
@@ -17,6 +17,8 @@ __all__ = [
     "AIAnalysisError",
     "TimeoutError",
     "RateLimitError",
+    "APIError",
+    "AuthenticationError",
     "WebSocketError",
     "PluginError",
     "ConfigurationError"
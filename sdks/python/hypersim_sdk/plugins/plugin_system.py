@@ -5,7 +5,7 @@ Plugin system foundation for extensibility using Python decorators and hooks.
 import asyncio
 import inspect
 from typing import (
-    Dict, List, Any, Optional, Callable, Union, TypeVar, Generic, 
+    Dict, List, Any, Optional, Callable, Set, Union, TypeVar, Generic, 
     get_type_hints, Awaitable
 )
 from abc import ABC, abstractmethod
@@ -38,9 +38,13 @@ class HookType(str, Enum):
     ON_SHUTDOWN = "on_shutdown"
 
 
-@dataclass
+@dataclass(slots=True)
 class HookContext:
-    """Hook execution context."""
+    """Hook execution context.
+    
+    Slotted because several are built per simulation; plugins should keep
+    extra state in ``metadata`` rather than adding attributes.
+    """
     request_id: str
     timestamp: float
     data: Any = None
@@ -55,6 +59,17 @@ class HookContext:
     def set_halt(self, halt: bool = True) -> None:
         """Set halt flag."""
         self.halt = halt
+    
+    def advance(self, data: Any, timestamp: float) -> None:
+        """Reuse this context for the next hook phase of the same request.
+        
+        Metadata is kept so plugins can carry state between phases; the
+        halt flag and modified data apply only to the phase that set them.
+        """
+        self.data = data
+        self.timestamp = timestamp
+        self.halt = False
+        self.modified_data = None
 
 
 class Plugin(ABC):
@@ -198,6 +213,8 @@ class PluginSystem:
         self._hooks: Dict[HookType, List[HookRegistration]] = {
             hook_type: [] for hook_type in HookType
         }
+        # Hook types with at least one registration, kept in step with _hooks
+        self._active_hooks: Set[HookType] = set()
         self._middleware: List[Callable] = []
         self._initialized = False
         self._lock = asyncio.Lock()
@@ -388,11 +405,9 @@ class PluginSystem:
                         print(f"[Plugin System] Failed to initialize plugin '{plugin_config.plugin.name}': {error}")
         
         # Execute startup hooks
-        startup_context = HookContext(
-            request_id="startup",
-            timestamp=asyncio.get_event_loop().time()
-        )
-        await self.execute_hooks(HookType.ON_STARTUP, startup_context)
+        if HookType.ON_STARTUP in self._active_hooks:
+            startup_context = HookContext("startup", asyncio.get_running_loop().time())
+            await self.execute_hooks(HookType.ON_STARTUP, startup_context)
         
         if self.debug:
             print(f"[Plugin System] Initialized with {len(self._plugins)} plugins")
@@ -403,11 +418,9 @@ class PluginSystem:
             return
         
         # Execute shutdown hooks
-        shutdown_context = HookContext(
-            request_id="shutdown",
-            timestamp=asyncio.get_event_loop().time()
-        )
-        await self.execute_hooks(HookType.ON_SHUTDOWN, shutdown_context)
+        if HookType.ON_SHUTDOWN in self._active_hooks:
+            shutdown_context = HookContext("shutdown", asyncio.get_running_loop().time())
+            await self.execute_hooks(HookType.ON_SHUTDOWN, shutdown_context)
         
         # Cleanup all plugins
         for plugin_config in self._plugins.values():
@@ -419,6 +432,7 @@ class PluginSystem:
         
         self._plugins.clear()
         self._hooks = {hook_type: [] for hook_type in HookType}
+        self._active_hooks.clear()
         self._middleware.clear()
         self._initialized = False
         
@@ -438,6 +452,7 @@ class PluginSystem:
                     hook_type=hook_type
                 )
                 self._hooks[hook_type].append(registration)
+                self._active_hooks.add(hook_type)
     
     def _unregister_plugin_hooks(self, plugin_name: str) -> None:
         """Unregister all hooks for a plugin."""
@@ -446,6 +461,8 @@ class PluginSystem:
                 reg for reg in self._hooks[hook_type] 
                 if reg.plugin_name != plugin_name
             ]
+            if not self._hooks[hook_type]:
+                self._active_hooks.discard(hook_type)
     
     def get_plugins(self) -> List[Dict[str, Any]]:
         """Get information about registered plugins."""
@@ -460,6 +477,13 @@ class PluginSystem:
             for config in self._plugins.values()
         ]
     
+    def has_hook(self, hook_type: HookType) -> bool:
+        """Check if any enabled plugin handles a hook type.
+        
+        Lets callers skip building a context when nothing would receive it.
+        """
+        return hook_type in self._active_hooks
+    
     def has_plugin(self, plugin_name: str) -> bool:
         """Check if a plugin is registered."""
         return plugin_name in self._plugins
@@ -18,6 +18,8 @@ __all__ = [
     "NetworkError",
     "TimeoutError",
     "RateLimitError",
+    "APIError",
+    "AuthenticationError",
     "SimulationError",
     "AIAnalysisError",
     "WebSocketError",
@@ -25,6 +25,9 @@ class AIConfig(BaseModel):
     timeout: float = Field(default=30.0, description="Request timeout")
     cache_enabled: bool = Field(default=True, description="Enable caching", alias='cacheEnabled')
     cache_ttl: int = Field(default=300, description="Cache TTL in seconds", alias='cacheTtl')
+    cache_size: int = Field(default=512, ge=0, description="Max cached responses", alias='cacheSize')
+    max_concurrency: int = Field(default=8, gt=0, description="Max concurrent AI requests", alias='maxConcurrency')
+    max_prompt_tokens: Optional[int] = Field(default=8000, gt=0, description="Prompt token budget before summarizing HyperCore data", alias='maxPromptTokens')
 
 
 # Risk Assessment Types
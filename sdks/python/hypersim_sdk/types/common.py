@@ -257,8 +257,11 @@ class RequestOptions(BaseModel):
     method: Optional[Literal['GET', 'POST', 'PUT', 'DELETE']] = Field(default=None, description="HTTP method")
     headers: Optional[Dict[str, str]] = Field(default=None, description="Request headers")
     body: Optional[Any] = Field(default=None, description="Request body")
+    params: Optional[Dict[str, Any]] = Field(default=None, description="Query parameters")
     timeout: Optional[int] = Field(default=None, description="Request timeout")
     retries: Optional[int] = Field(default=None, description="Retry attempts")
+    dedupe: Optional[bool] = Field(default=None, description="Share identical in-flight requests (default: GET/HEAD only)")
+    cache_ttl: Optional[float] = Field(default=None, description="Seconds to cache the parsed response")
 
 
 class Response(BaseModel, Generic[T]):
@@ -279,16 +282,6 @@ class ErrorContext(BaseModel):
     metadata: Optional[Dict[str, Any]] = Field(default=None, description="Error metadata")
 
 
-# Retry Configuration
-class RetryConfig(BaseModel):
-    """Retry configuration."""
-    max_attempts: int = Field(..., description="Max attempts", alias='maxAttempts')
-    base_delay: int = Field(..., description="Base delay", alias='baseDelay')
-    max_delay: int = Field(..., description="Max delay", alias='maxDelay')
-    backoff_multiplier: float = Field(..., description="Backoff multiplier", alias='backoffMultiplier')
-    jitter: bool = Field(..., description="Add jitter")
-
-
 # Rate Limiting
 class RateLimitConfig(BaseModel):
     """Rate limit configuration."""
@@ -397,6 +390,7 @@ class RetryConfig(BaseModel):
     initial_delay: float = Field(default=1.0, description="Initial delay in seconds", alias='initialDelay')
     backoff_multiplier: float = Field(default=2.0, description="Backoff multiplier", alias='backoffMultiplier')
     max_delay: float = Field(default=30.0, description="Maximum delay in seconds", alias='maxDelay')
+    jitter: bool = Field(default=True, description="Add jitter")
 
 
 class ConnectionPoolConfig(BaseModel):
@@ -2,7 +2,7 @@
 Core error types and exception hierarchy for HyperSim SDK.
 """
 
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Union
 
 
 class HyperSimError(Exception):
@@ -71,10 +71,40 @@ class RateLimitError(NetworkError):
         self,
         message: str,
         retry_after: Optional[int] = None,
+        context: Optional[Any] = None,
         **kwargs
     ) -> None:
         super().__init__(message, **kwargs)
         self.retry_after = retry_after
+        self.context = context
+
+
+class APIError(NetworkError):
+    """Raised when an HTTP or JSON-RPC API returns an error response."""
+    
+    def __init__(
+        self,
+        message: str,
+        status_code: Optional[int] = None,
+        context: Optional[Any] = None,
+        body: Union[bytes, str, Any, None] = None,
+        **kwargs
+    ) -> None:
+        super().__init__(message, status_code=status_code, **kwargs)
+        self.context = context
+        self._body = body
+    
+    @property
+    def body(self) -> Any:
+        """Error payload; raw response bytes are decoded on first access."""
+        if isinstance(self._body, (bytes, bytearray)):
+            self._body = self._body.decode("utf-8", errors="replace")
+        return self._body
+
+
+class AuthenticationError(APIError):
+    """Raised when an API rejects the request's credentials (HTTP 401/403)."""
+    pass
 
 
 class SimulationError(HyperSimError):
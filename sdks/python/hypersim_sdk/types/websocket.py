@@ -65,15 +65,23 @@ class WSConfig(BaseModel):
     
     ws_endpoint: Optional[str] = Field(default=None, description="WebSocket endpoint URL")
     connection_timeout: float = Field(default=10.0, gt=0, description="Connection timeout in seconds")
+    shutdown_timeout: float = Field(default=5.0, gt=0, description="Seconds to wait for the connection loop and socket to close on disconnect")
     reconnect_interval: float = Field(default=5.0, gt=0, description="Reconnection interval in seconds")
     max_reconnect_attempts: int = Field(default=10, ge=0, description="Maximum reconnection attempts")
     heartbeat_interval: float = Field(default=30.0, gt=0, description="Heartbeat interval in seconds")
-    compression: bool = Field(default=True, description="Enable compression")
+    compression: bool = Field(default=False, description="Enable permessage-deflate compression")
+    raw_binary: bool = Field(default=False, description="Deliver binary frames as raw bytes on the 'binary' channel instead of parsing them as JSON")
     debug: bool = Field(default=False, description="Enable debug logging")
+    use_uvloop: bool = Field(default=False, description="Install the uvloop event loop policy when available")
+    eager_tasks: bool = Field(default=False, description="Use asyncio's eager task factory on Python 3.12+")
     
     # Message handling
     max_message_size: int = Field(default=1024*1024, gt=0, description="Maximum message size in bytes")
     message_queue_size: int = Field(default=1000, gt=0, description="Message queue size")
+    inbound_queue_max: int = Field(default=32, gt=0, description="Received frames buffered before reads pause (backpressure)")
+    write_limit: int = Field(default=64*1024, gt=0, description="Outgoing buffer high-water mark in bytes before sends wait")
+    batch_sends: bool = Field(default=False, description="Coalesce queued outbound messages into one JSON array frame (server must accept arrays)")
+    send_batch_size: int = Field(default=50, gt=0, description="Maximum messages per batched frame")
     auto_reconnect: bool = Field(default=True, description="Enable automatic reconnection")
     
     # Rate limiting
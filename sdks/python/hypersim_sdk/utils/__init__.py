@@ -5,6 +5,8 @@ Utils package initialization.
 from .validators import *
 from .formatters import *
 from .constants import *
+from .serialization import *
+from .caching import *
 
 __all__ = [
     # Validators
@@ -36,6 +38,18 @@ __all__ = [
     "format_duration",
     "format_number_compact",
     
+    # Serialization
+    "HAS_ORJSON",
+    "JSONDecodeError",
+    "json_loads",
+    "json_dumps",
+    "json_dumps_bytes",
+    "json_dumps_pretty",
+    
+    # Caching
+    "ttl_cached",
+    "evict_expired",
+    
     # Constants
     "SDK_VERSION",
     "SDK_NAME",
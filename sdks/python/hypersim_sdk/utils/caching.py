@@ -0,0 +1,86 @@
+"""
+Async caching helpers.
+"""
+
+import asyncio
+import functools
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Awaitable[Any]])
+
+
+def ttl_cached(ttl: float, max_entries: int = 64) -> Callable[[F], F]:
+    """Cache an async method's result per instance and arguments for ``ttl`` seconds.
+    
+    Concurrent callers that miss the cache share a single upstream call: the
+    first acquires a per-key lock and the rest re-check the entry once it is
+    released. Exceptions are not cached. Entries live in the instance's
+    ``_ttl_cache`` dict, which is created on first use if absent, and expired
+    entries are swept out whenever the dict reaches ``max_entries``.
+    
+    Args:
+        ttl: Lifetime of a cached result in seconds
+        max_entries: Cache size at which expired entries are evicted
+        
+    Returns:
+        Decorator for async methods with hashable arguments
+    """
+    def decorator(func: F) -> F:
+        name = func.__name__
+        
+        @functools.wraps(func)
+        async def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+            try:
+                cache: Dict[Hashable, List[Any]] = self._ttl_cache
+            except AttributeError:
+                cache = self._ttl_cache = {}
+            
+            key = (name, args, tuple(sorted(kwargs.items()))) if kwargs else (name, args)
+            
+            # Entry layout: [expires_at, value, lock]
+            entry = cache.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                return entry[1]
+            
+            if entry is None:
+                if len(cache) >= max_entries:
+                    evict_expired(cache)
+                entry = cache[key] = [0.0, None, asyncio.Lock()]
+            
+            async with entry[2]:
+                if entry[0] > time.monotonic():
+                    return entry[1]
+                
+                value = await func(self, *args, **kwargs)
+                entry[0] = time.monotonic() + ttl
+                entry[1] = value
+                return value
+        
+        return wrapper  # type: ignore[return-value]
+    
+    return decorator
+
+
+def evict_expired(cache: Dict[Hashable, List[Any]]) -> int:
+    """Remove expired entries from a ``ttl_cached`` backing dict.
+    
+    Entries whose lock is held are kept, since a refresh is in flight.
+    
+    Args:
+        cache: An instance's ``_ttl_cache`` dict
+        
+    Returns:
+        Number of entries removed
+    """
+    now = time.monotonic()
+    expired = [
+        key for key, entry in cache.items()
+        if entry[0] <= now and not entry[2].locked()
+    ]
+    for key in expired:
+        del cache[key]
+    return len(expired)
+
+
+__all__ = ["ttl_cached", "evict_expired"]
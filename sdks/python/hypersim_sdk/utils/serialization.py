@@ -0,0 +1,79 @@
+"""
+JSON serialization helpers with optional orjson acceleration.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
+
+# True when the orjson C extension is available
+HAS_ORJSON = orjson is not None
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so this catches both
+JSONDecodeError = json.JSONDecodeError
+
+
+def json_loads(data: Union[str, bytes, bytearray, memoryview]) -> Any:
+    """Parse JSON from text or raw bytes.
+
+    Args:
+        data: JSON document
+
+    Returns:
+        Any: Parsed object
+
+    Raises:
+        JSONDecodeError: If data is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+
+def json_dumps_bytes(data: Any) -> bytes:
+    """Serialize data as compact UTF-8 JSON bytes.
+
+    Args:
+        data: Data to serialize
+
+    Returns:
+        bytes: Compact JSON document
+    """
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode()
+
+
+def json_dumps(data: Any) -> str:
+    """Serialize data as compact JSON text.
+
+    Args:
+        data: Data to serialize
+
+    Returns:
+        str: Compact JSON string
+    """
+    if orjson is not None:
+        return orjson.dumps(data).decode()
+    return json.dumps(data, separators=(',', ':'), ensure_ascii=False)
+
+
+def json_dumps_pretty(data: Any) -> str:
+    """Serialize data as JSON text indented by two spaces.
+
+    Args:
+        data: Data to serialize
+
+    Returns:
+        str: Pretty JSON string
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(data, indent=2)
@@ -3,6 +3,7 @@ Validation utilities for HyperSim SDK.
 """
 
 import re
+from functools import lru_cache
 from typing import Optional, Union, Dict, Any
 from ..types.errors import ValidationError
 from ..types.network import Network
@@ -117,16 +118,22 @@ def validate_network(network: Union[str, Network]) -> Network:
     Raises:
         ValidationError: If network is invalid
     """
+    if isinstance(network, Network):
+        return network
+    
     if isinstance(network, str):
         try:
-            return Network(network.lower())
+            return _network_from_string(network)
         except ValueError:
             raise ValidationError(f"Invalid network: {network}. Supported: {list(Network)}")
     
-    if not isinstance(network, Network):
-        raise ValidationError(f"Network must be string or Network enum, got {type(network)}")
-    
-    return network
+    raise ValidationError(f"Network must be string or Network enum, got {type(network)}")
+
+
+@lru_cache(maxsize=128)
+def _network_from_string(network: str) -> Network:
+    """Resolve a network name; cached since configs repeat the same few names."""
+    return Network(network.lower())
 
 
 def validate_transaction_request(transaction: TransactionRequest) -> None:
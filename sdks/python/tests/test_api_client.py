@@ -0,0 +1,63 @@
+"""
+Smoke tests for the HTTP and JSON-RPC API clients.
+"""
+
+import httpx
+import pytest
+
+from hypersim_sdk.api.client import HTTPClient, JSONRPCClient
+from hypersim_sdk.exceptions import APIError, AuthenticationError, RateLimitError
+from hypersim_sdk.types.common import ErrorContext
+from hypersim_sdk.types.common import RequestOptions
+
+
+def test_http_client_constructs_with_defaults():
+    client = HTTPClient("https://api.example.com/")
+    
+    assert client.base_url == "https://api.example.com"
+    assert client._delay_schedule == (1.0, 2.0, 4.0)
+
+
+def test_jsonrpc_client_constructs_with_batching():
+    client = JSONRPCClient("https://rpc.example.com", micro_batch_ms=2, max_batch=10)
+    
+    assert client._rpc_url == "https://rpc.example.com/"
+    assert client._max_batch == 10
+
+
+def test_authentication_error_is_api_error():
+    error = AuthenticationError("Access forbidden", 403)
+    
+    assert isinstance(error, APIError)
+    assert error.status_code == 403
+
+
+def test_request_options_cache_ttl_by_field_name():
+    assert RequestOptions(cache_ttl=5).cache_ttl == 5
+
+
+def _response(status_code, headers=None):
+    return httpx.Response(status_code, headers=headers, request=httpx.Request("GET", "https://api.example.com/"))
+
+
+def test_rate_limit_response_raises_rate_limit_error():
+    client = HTTPClient("https://api.example.com")
+    context = ErrorContext(operation="GET /", timestamp=0)
+    
+    with pytest.raises(RateLimitError) as excinfo:
+        client._handle_response_status(_response(429, {"Retry-After": "7"}), context)
+        
+    assert excinfo.value.retry_after == 7
+    assert excinfo.value.context is context
+
+
+def test_rate_limit_accepts_http_date_retry_after():
+    client = HTTPClient("https://api.example.com")
+    context = ErrorContext(operation="GET /", timestamp=0)
+    
+    with pytest.raises(RateLimitError) as excinfo:
+        client._handle_response_status(
+            _response(429, {"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}), context
+        )
+        
+    assert excinfo.value.retry_after == 0